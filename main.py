@@ -7,6 +7,18 @@ Este programa permite simular diferentes modelos de computación:
 -> GLC: Gramáticas Libres de Contexto
 -> AP: Autómata de Pila
 -> MT: Máquina de Turing
+-> EXPRESION_REGULAR: Expresión Regular (compilada a AFD mínimo)
+-> PRODUCTO_AFD: Combinaciones booleanas de AFDs (producto perezoso)
+-> EQUIVALENCIA_AFD: Equivalencia e inclusión de lenguajes entre AFDs
+-> ENUMERACION: Enumeración, conteo y muestreo de cadenas de una gramática
+-> DIFERENCIAL: Pruebas diferenciales y rendimiento entre modelos equivalentes
+-> BOSQUE_GLC: Bosque de análisis, conteo de árboles y ambigüedad de una GLC
+
+Los AFD y MT muy grandes pueden guardarse en formato binario (.simb,
+ver modos/binario.py) y se cargan con mmap sin analizar JSON.
+
+Los modos se cargan bajo demanda desde modos/registro.py; los paquetes
+instalados pueden agregar modos con entry points del grupo "simulador.modos".
 
 USO:
 1. Coloca archivos JSON en la carpeta ejemplos
@@ -17,11 +29,7 @@ USO:
 
 import json
 import os
-from modos.afd import ModoAFD
-from modos.glc import ModoGLC
-from modos.gramatica_regular import ModoGramaticaRegular
-from modos.ap import ModoAP
-from modos.mt import ModoMT
+from modos import registro
 
 def ejecutar_archivo(nombre_archivo):
     ruta = os.path.join("ejemplos", nombre_archivo)
@@ -31,6 +39,16 @@ def ejecutar_archivo(nombre_archivo):
         print(f"❌ El archivo '{nombre_archivo}' no existe en la carpeta 'ejemplos/'.")
         return False
     
+    # Modelo binario: se mapea en memoria, no hay JSON que analizar
+    if nombre_archivo.endswith(".simb"):
+        from modos import binario
+        try:
+            simulador = binario.cargar(ruta)
+        except (ValueError, OSError) as e:
+            print(e)
+            return False
+        return procesar_entradas(simulador, f"{simulador.modo} (binario)", nombre_archivo)
+    
     try:
         with open(ruta, 'r', encoding='utf-8') as archivo:
             data = json.load(archivo)
@@ -41,8 +59,16 @@ def ejecutar_archivo(nombre_archivo):
         print(f"❌ Error inesperado: {e}")
         return False
     
-    # Identificar el modo
-    modo = data.get("modo", "").upper()
+    # Crear el simulador una sola vez: el módulo del modo se importa aquí
+    try:
+        simulador = registro.compilar(data)
+    except ValueError as e:
+        print(e)
+        return False
+    
+    return procesar_entradas(simulador, data.get("modo", "").upper(), nombre_archivo)
+
+def procesar_entradas(simulador, modo, nombre_archivo):
     print(f"\n{'='*50}")
     print(f"Modo: {modo}")
     print(f"Configuración: {nombre_archivo}")
@@ -56,27 +82,9 @@ def ejecutar_archivo(nombre_archivo):
         if entrada.lower() == 'salir':
             return True
         
-        # Agregar la entrada al diccionario de datos
-        data["entrada"] = entrada
-        
-        # Selección del modo y creación del simulador
-        if modo == "AFD":
-            simulador = ModoAFD(data)
-        elif modo == "GLC":
-            simulador = ModoGLC(data)
-        elif modo == "GRAMATICA_REGULAR":
-            simulador = ModoGramaticaRegular(data)
-        elif modo == "AP":
-            simulador = ModoAP(data)
-        elif modo == "MT":
-            simulador = ModoMT(data)
-        else:
-            print(f"❌ Modo '{modo}' no reconocido. Modos válidos: AFD, GLC, GRAMATICA_REGULAR, AP, MT")
-            return False
-        
         # Ejecutar la simulación
         try:
-            simulador.ejecutar()
+            registro.ejecutar(simulador, entrada)
         except Exception as e:
             print(f"❌ Error durante la simulación: {e}")
         
@@ -95,7 +103,7 @@ def main():
     
     while True:
         # Mostrar los JSON disponibles
-        archivos = [f for f in os.listdir("ejemplos") if f.endswith(".json")]
+        archivos = [f for f in os.listdir("ejemplos") if f.endswith((".json", ".simb"))]
         
         if not archivos:
             print("\n❌ No hay archivos JSON en la carpeta 'ejemplos/'")
@@ -123,7 +131,7 @@ def main():
                 print("❌ Número inválido.")
                 continue
         else:
-            nombre_archivo = seleccion if seleccion.endswith(".json") else f"{seleccion}.json"
+            nombre_archivo = seleccion if seleccion.endswith((".json", ".simb")) else f"{seleccion}.json"
         
         # Ejecutar el archivo
         continuar = ejecutar_archivo(nombre_archivo)
@@ -24,34 +24,71 @@ class ModoAFD:
         if not self.estado_inicial:
             raise ValueError("❌ Falta definir el estado inicial")
         
-        if self.estado_inicial not in self.estados:
+        # Conjuntos para búsquedas O(1) en autómatas grandes
+        estados = set(self.estados)
+        self._finales = set(self.estados_finales)
+        
+        if self.estado_inicial not in estados:
             raise ValueError(f"❌ El estado inicial '{self.estado_inicial}' no está en la lista de estados")
         
         for estado_final in self.estados_finales:
-            if estado_final not in self.estados:
+            if estado_final not in estados:
                 raise ValueError(f"❌ El estado final '{estado_final}' no está en la lista de estados")
         
         # Validar transiciones
         for estado, trans in self.transiciones.items():
-            if estado not in self.estados:
+            if estado not in estados:
                 raise ValueError(f"❌ Estado '{estado}' en transiciones no está definido en estados")
             for simbolo, destino in trans.items():
-                if destino not in self.estados:
+                if destino not in estados:
                     raise ValueError(f"❌ Estado destino '{destino}' no está definido")
     
+    def transicion(self, estado, simbolo):
+        """
+        Retorna el estado destino de δ(estado, simbolo) o None si no hay transición.
+        Usa el comodín '*' cuando no existe transición exacta.
+        """
+        trans = self.transiciones.get(estado)
+        if trans is None:
+            return None
+        if simbolo in trans:
+            return trans[simbolo]
+        return trans.get("*")
+    
+    def es_final(self, estado):
+        """Verifica si un estado es de aceptación"""
+        return estado in self._finales
+    
+    def _usa_comodin(self, estado, simbolo):
+        """Verifica si δ(estado, simbolo) se resuelve con el comodín '*'"""
+        return simbolo not in self.transiciones.get(estado, {})
+    
+    def _nombre_estado(self, estado):
+        """Nombre del estado para mostrar"""
+        return estado
+    
+    def acepta(self, cadena):
+        """Procesa la cadena sin imprimir nada y retorna True si es aceptada"""
+        estado = self.estado_inicial
+        for simbolo in cadena:
+            estado = self.transicion(estado, simbolo)
+            if estado is None:
+                return False
+        return self.es_final(estado)
+    
     def ejecutar(self):
         """Ejecuta la simulación del AFD"""
         estado_actual = self.estado_inicial
         COMODIN = "*"
         
         print(f"\n📝 Descripción: {self.descripcion}")
-        print(f"🎯 Estado inicial: {estado_actual}")
+        print(f"🎯 Estado inicial: {self._nombre_estado(estado_actual)}")
         print(f"✅ Estados finales: {', '.join(self.estados_finales)}")
         print(f"📥 Cadena de entrada: '{self.entrada}'")
         
         if not self.entrada:
             print("\n⚠️  Cadena vacía (ε)")
-            if estado_actual in self.estados_finales:
+            if self.es_final(estado_actual):
                 print("✅ Cadena ACEPTADA (estado inicial es final)")
             else:
                 print("❌ Cadena RECHAZADA (estado inicial no es final)")
@@ -68,30 +105,22 @@ class ModoAFD:
                 print(f"⚠️  Paso {i}: '{simbolo}' no está en el alfabeto definido")
                 # Puedes decidir si rechazar o continuar
             
-            # Buscar transición
-            if estado_actual in self.transiciones:
-                if simbolo in self.transiciones[estado_actual]:
-                    nuevo_estado = self.transiciones[estado_actual][simbolo]
-                    print(f"  Paso {i}: δ({estado_actual}, '{simbolo}') → {nuevo_estado}")
-                    estado_actual = nuevo_estado
-                elif COMODIN in self.transiciones[estado_actual]:
-                    nuevo_estado = self.transiciones[estado_actual][COMODIN]
-                    print(f"  Paso {i}: δ({estado_actual}, '{simbolo}') → {nuevo_estado} [comodín]")
-                    estado_actual = nuevo_estado
-                else:
-                    print(f"\n❌ No hay transición para '{simbolo}' desde estado '{estado_actual}'")
-                    print(f"❌ Cadena RECHAZADA")
-                    return
-            else:
-                print(f"\n❌ No hay transiciones definidas para el estado '{estado_actual}'")
+            # Buscar transición (exacta o comodín)
+            nuevo_estado = self.transicion(estado_actual, simbolo)
+            if nuevo_estado is None:
+                print(f"\n❌ No hay transición para '{simbolo}' desde estado '{self._nombre_estado(estado_actual)}'")
                 print(f"❌ Cadena RECHAZADA")
                 return
+            
+            marca = " [comodín]" if self._usa_comodin(estado_actual, simbolo) else ""
+            print(f"  Paso {i}: δ({self._nombre_estado(estado_actual)}, '{simbolo}') → {self._nombre_estado(nuevo_estado)}{marca}")
+            estado_actual = nuevo_estado
         
         # Verificar si el estado final es de aceptación
         print(f"\n{'─'*50}")
-        print(f"🏁 Estado final alcanzado: {estado_actual}")
+        print(f"🏁 Estado final alcanzado: {self._nombre_estado(estado_actual)}")
         
-        if estado_actual in self.estados_finales:
+        if self.es_final(estado_actual):
             print("✅ Cadena ACEPTADA ✅")
         else:
             print("❌ Cadena RECHAZADA (no terminó en estado de aceptación)")
\ No newline at end of file
@@ -4,7 +4,12 @@ Simula un Autómata de Pila (AP)
 
 El AP utiliza una pila para reconocer lenguajes libres de contexto.
 Acepta por estado final Y entrada completamente consumida.
+
+Las ejecuciones largas pueden guardar checkpoints (estado, pila, posición
+en la entrada y pasos) y reanudarse con un nuevo presupuesto de pasos
+mediante checkpoint_ruta, checkpoint_cada y reanudar_desde (ver modos/mt.py).
 """
+from utils.helpers import cargar_checkpoint, guardar_checkpoint, huella_modelo
 
 class ModoAP:
     def __init__(self, data):
@@ -18,6 +23,9 @@ class ModoAP:
         self.descripcion = data.get("descripcion", "Sin descripción")
         self.epsilon_simbolos = ["epsilon", "eps", "e", "", "ε"]
         self.max_pasos = data.get("max_pasos", 500)
+        self.checkpoint_ruta = data.get("checkpoint_ruta")
+        self.checkpoint_cada = data.get("checkpoint_cada", 0)
+        self.reanudar_desde = data.get("reanudar_desde")
         
         # Validar configuración
         self._validar_configuracion()
@@ -57,6 +65,94 @@ class ModoAP:
         
         return None
     
+    def _siguiente_transicion(self, estado, cima, entrada, idx):
+        """
+        Busca la transición a aplicar. Solo usa ε si NO queda entrada.
+        Retorna: (nuevo_estado, accion, clave, avanzar) o None
+        """
+        if idx < len(entrada):
+            resultado = self.buscar_transicion(estado, entrada[idx], cima)
+            return resultado + (True,) if resultado else None
+        
+        for eps in ['epsilon', 'ε']:
+            resultado = self.buscar_transicion(estado, eps, cima)
+            if resultado:
+                return resultado + (False,)
+        return None
+    
+    def _aplicar_accion(self, pila, accion):
+        """Hace POP de la cima y luego PUSH de la acción (si no es pop ni ε)"""
+        # Siempre hacer POP de la cima primero
+        if pila:
+            pila.pop()
+        
+        # Luego PUSH según la acción
+        if accion == "pop":
+            # Solo pop, no push nada
+            pass
+        elif not self.es_epsilon(accion):
+            # Push los símbolos en orden inverso (para que queden en orden correcto)
+            for simbolo_pila in reversed(accion):
+                pila.append(simbolo_pila)
+        # Si accion es epsilon, solo hicimos pop
+    
+    def _huella(self):
+        """Identifica el autómata para no reanudar checkpoints de otro"""
+        return huella_modelo(self.estado_inicial, self.estados_finales,
+                             self.pila_inicial, self.transiciones)
+    
+    def _guardar_checkpoint(self, entrada, estado, pila, idx, pasos):
+        """Guarda la configuración en checkpoint_ruta"""
+        guardar_checkpoint(self.checkpoint_ruta, {
+            "modo": "AP",
+            "huella": self._huella(),
+            "entrada": entrada,
+            "estado": estado,
+            "pila": pila,
+            "idx": idx,
+            "pasos": pasos,
+        })
+    
+    def _checkpoint_periodico(self, entrada, estado, pila, idx, pasos):
+        if self.checkpoint_ruta and self.checkpoint_cada and pasos % self.checkpoint_cada == 0:
+            self._guardar_checkpoint(entrada, estado, pila, idx, pasos)
+    
+    def _configuracion_inicial(self, entrada):
+        """
+        Retorna (estado, pila, idx, pasos, reanudado): la configuración de
+        reanudar_desde si corresponde a este autómata y entrada, o la inicial.
+        """
+        if self.reanudar_desde:
+            checkpoint = cargar_checkpoint(self.reanudar_desde)
+            if checkpoint is not None and checkpoint.get("entrada") == entrada:
+                if checkpoint.get("modo") != "AP" or checkpoint.get("huella") != self._huella():
+                    raise ValueError(f"❌ El checkpoint '{self.reanudar_desde}' no corresponde a este autómata")
+                return (checkpoint["estado"], checkpoint["pila"], checkpoint["idx"],
+                        checkpoint["pasos"], True)
+        return self.estado_inicial, [self.pila_inicial], 0, 0, False
+    
+    def acepta(self, cadena):
+        """Procesa la cadena sin imprimir nada y retorna True si es aceptada"""
+        estado, pila, idx, pasos, _ = self._configuracion_inicial(cadena)
+        limite = pasos + self.max_pasos
+        while pasos < limite:
+            pasos += 1
+            cima = pila[-1] if pila else "ε"
+            resultado = self._siguiente_transicion(estado, cima, cadena, idx)
+            if resultado is None:
+                if idx < len(cadena):
+                    return False
+                break
+            estado, accion, _, avanzar = resultado
+            self._aplicar_accion(pila, accion)
+            if avanzar:
+                idx += 1
+            self._checkpoint_periodico(cadena, estado, pila, idx, pasos)
+        else:
+            if self.checkpoint_ruta:
+                self._guardar_checkpoint(cadena, estado, pila, idx, pasos)
+        return estado in self.estados_finales and idx == len(cadena)
+    
     def _mostrar_transiciones(self):
         """Muestra todas las transiciones del autómata"""
         print("\n📐 Transiciones del Autómata de Pila:")
@@ -77,70 +173,44 @@ class ModoAP:
         # Mostrar transiciones
         self._mostrar_transiciones()
         
-        # Inicializar configuración
-        estado = self.estado_inicial
-        pila = [self.pila_inicial]
-        idx = 0  # Índice en la cadena de entrada
-        pasos = 0
+        # Inicializar configuración (idx: índice en la cadena de entrada)
+        estado, pila, idx, pasos, reanudado = self._configuracion_inicial(self.entrada)
+        limite = pasos + self.max_pasos
         
         print(f"\n{'─'*70}")
-        print(f"Configuración inicial: ({estado}, '{self.entrada}', {pila})")
+        if reanudado:
+            print(f"♻️  Reanudando desde '{self.reanudar_desde}' (paso {pasos})")
+            print(f"Configuración reanudada: ({estado}, '{self.entrada[idx:]}', {pila})")
+        else:
+            print(f"Configuración inicial: ({estado}, '{self.entrada}', {pila})")
         print(f"{'─'*70}")
         print("Procesando transiciones:\n")
         
         # Procesar la entrada
-        while pasos < self.max_pasos:
+        while pasos < limite:
             pasos += 1
             
             # Obtener cima de la pila
             cima = pila[-1] if pila else "ε"
             
             # REGLA CLAVE: Solo usar epsilon si NO hay más entrada
-            if idx < len(self.entrada):
-                # Hay entrada por procesar
-                simbolo = self.entrada[idx]
-                resultado = self.buscar_transicion(estado, simbolo, cima)
-                
-                if resultado is None:
+            resultado = self._siguiente_transicion(estado, cima, self.entrada, idx)
+            
+            if resultado is None:
+                if idx < len(self.entrada):
+                    simbolo = self.entrada[idx]
                     print(f"  Paso {pasos}: ❌ No hay transición desde ({estado}, '{simbolo}', '{cima}')")
                     print(f"\n{'─'*70}")
                     print(f"❌ Cadena RECHAZADA (sin transición válida)")
                     print(f"   Quedaron {len(self.entrada) - idx} símbolos sin procesar: '{self.entrada[idx:]}'")
                     return
-                
-                nuevo_estado, accion, clave = resultado
-                simbolo_usado = simbolo
-                avanzar = True
-                
-            else:
-                # NO hay más entrada, buscar transición epsilon
-                for eps in ['epsilon', 'ε']:
-                    resultado = self.buscar_transicion(estado, eps, cima)
-                    if resultado:
-                        break
-                
-                if resultado is None:
-                    # No hay transición epsilon, terminamos
-                    break
-                
-                nuevo_estado, accion, clave = resultado
-                simbolo_usado = "ε"
-                avanzar = False
+                # No hay transición epsilon, terminamos
+                break
             
-            # APLICAR TRANSICIÓN A LA PILA
-            # Siempre hacer POP de la cima primero
-            if pila:
-                pila.pop()
+            nuevo_estado, accion, clave, avanzar = resultado
             
-            # Luego PUSH según la acción
-            if accion == "pop":
-                # Solo pop, no push nada
-                pass
-            elif not self.es_epsilon(accion):
-                # Push los símbolos en orden inverso (para que queden en orden correcto)
-                for simbolo_pila in reversed(accion):
-                    pila.append(simbolo_pila)
-            # Si accion es epsilon, solo hicimos pop
+            # APLICAR TRANSICIÓN A LA PILA
+            self._aplicar_accion(pila, accion)
             
             # Calcular entrada restante
             if avanzar:
@@ -160,6 +230,12 @@ class ModoAP:
             # Avanzar en la entrada SOLO si consumimos un símbolo real
             if avanzar:
                 idx += 1
+            
+            self._checkpoint_periodico(self.entrada, estado, pila, idx, pasos)
+        else:
+            if self.checkpoint_ruta:
+                self._guardar_checkpoint(self.entrada, estado, pila, idx, pasos)
+                print(f"\n💾 Checkpoint guardado en '{self.checkpoint_ruta}' (paso {pasos})")
         
         # Verificar aceptación
         print(f"\n{'─'*70}")
@@ -180,5 +256,5 @@ class ModoAP:
         else:
             print("❌ Cadena RECHAZADA")
         
-        if pasos >= self.max_pasos:
+        if pasos >= limite:
             print(f"⚠️  Advertencia: Se alcanzó el límite de {self.max_pasos} pasos")
\ No newline at end of file
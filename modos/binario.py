@@ -0,0 +1,365 @@
+# modos/binario.py
+"""
+Formato binario compacto para AFDs y MTs muy grandes (.simb)
+
+Un JSON con 10^6 transiciones tarda segundos en cargarse con json.load y
+en interpretar cada clave. El formato binario guarda los estados y
+símbolos como índices enteros y las transiciones como arreglos planos,
+así que se carga con mmap sin analizar nada: las páginas del archivo se
+leen del disco solo cuando la simulación las toca.
+
+Estructura (little-endian, todas las secciones alineadas a 4 bytes):
+- encabezado: ver _ENCABEZADO
+- metadatos: JSON pequeño (descripción, alfabeto y tabla de símbolos)
+- nombres de estados: desplazamientos int32 (n + 1) + texto UTF-8
+- finales: un byte por estado
+- AFD: destino int32 [estado * n_simbolos + simbolo], -1 = sin transición
+- MT: destino, símbolo a escribir y movimiento (código del carácter),
+  tres arreglos int32 con la misma disposición
+
+Uso desde la línea de comandos:
+    python -m modos.binario entrada.json salida.simb
+"""
+import hashlib
+import json
+import mmap
+import struct
+import sys
+import time
+from array import array
+
+from modos.afd import ModoAFD
+from modos.mt import ModoMT
+from utils.helpers import cargar_configuracion
+
+EXTENSION = ".simb"
+MAGICO = b"SIMB"
+VERSION = 1
+TIPOS = {"AFD": 1, "MT": 2}
+COMODIN = "*"
+
+# mágico, versión, tipo, estados, símbolos, inicial, blanco, max_pasos, bytes de metadatos
+_ENCABEZADO = struct.Struct("<4sHHiiiiiI")
+
+
+def _alinear(n):
+    return (n + 3) & ~3
+
+
+def _escribir_enteros(archivo, valores):
+    arreglo = array("i", valores)
+    if sys.byteorder != "little":
+        arreglo.byteswap()
+    archivo.write(arreglo.tobytes())
+
+
+class _Nombres:
+    """Secuencia de nombres de estados decodificada bajo demanda"""
+
+    def __init__(self, desplazamientos, texto):
+        self._desplazamientos = desplazamientos
+        self._texto = texto
+
+    def __len__(self):
+        return len(self._desplazamientos) - 1
+
+    def __getitem__(self, i):
+        inicio, fin = self._desplazamientos[i], self._desplazamientos[i + 1]
+        return bytes(self._texto[inicio:fin]).decode("utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _Finales:
+    """Conjunto de estados finales respaldado por un byte por estado"""
+
+    def __init__(self, banderas, nombres):
+        self._banderas = banderas
+        self._nombres = nombres
+
+    def __contains__(self, estado):
+        return isinstance(estado, int) and 0 <= estado < len(self._banderas) and bool(self._banderas[estado])
+
+    def _indices(self):
+        return [q for q, final in enumerate(self._banderas) if final]
+
+    def __len__(self):
+        return len(self._indices())
+
+    def __iter__(self):
+        return (self._nombres[q] for q in self._indices())
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _Modelo:
+    """Vistas de solo lectura sobre un archivo .simb mapeado en memoria"""
+
+    def __init__(self, ruta):
+        with open(ruta, "rb") as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        datos = memoryview(self._mapa)
+
+        if len(datos) < _ENCABEZADO.size:
+            raise ValueError(f"❌ '{ruta}' no es un modelo binario válido")
+        (magico, version, tipo, self.n_estados, self.n_simbolos, self.inicial,
+         self.blanco, self.max_pasos, largo_meta) = _ENCABEZADO.unpack_from(datos, 0)
+        if magico != MAGICO:
+            raise ValueError(f"❌ '{ruta}' no es un modelo binario válido")
+        if version != VERSION:
+            raise ValueError(f"❌ Versión de formato {version} no soportada (se esperaba {VERSION})")
+        self.tipo = next((nombre for nombre, codigo in TIPOS.items() if codigo == tipo), None)
+        if self.tipo is None:
+            raise ValueError(f"❌ Tipo de modelo {tipo} no reconocido")
+
+        pos = _ENCABEZADO.size
+        self.meta = json.loads(bytes(datos[pos:pos + largo_meta]).decode("utf-8"))
+        pos = _alinear(pos + largo_meta)
+
+        self.desplazamientos = self._enteros(datos, pos, self.n_estados + 1)
+        pos += 4 * (self.n_estados + 1)
+        largo_texto = self.desplazamientos[-1]
+        self.texto = datos[pos:pos + largo_texto]
+        pos = _alinear(pos + largo_texto)
+
+        self.finales = datos[pos:pos + self.n_estados]
+        pos = _alinear(pos + self.n_estados)
+
+        celdas = self.n_estados * self.n_simbolos
+        self.destinos = self._enteros(datos, pos, celdas)
+        pos += 4 * celdas
+        if self.tipo == "MT":
+            self.escrituras = self._enteros(datos, pos, celdas)
+            pos += 4 * celdas
+            self.movimientos = self._enteros(datos, pos, celdas)
+
+        self.simbolos = self.meta["simbolos"]
+        self.indice_simbolo = {s: i for i, s in enumerate(self.simbolos)}
+        self.comodin = self.indice_simbolo.get(COMODIN, -1)
+        self.nombres = _Nombres(self.desplazamientos, self.texto)
+
+    @staticmethod
+    def _enteros(datos, pos, cantidad):
+        vista = datos[pos:pos + 4 * cantidad]
+        if sys.byteorder == "little":
+            return vista.cast("i")
+        # En máquinas big-endian se paga una copia
+        arreglo = array("i", bytes(vista))
+        arreglo.byteswap()
+        return arreglo
+
+    def celda(self, estado, simbolo):
+        """Índice plano de δ(estado, simbolo) o None si no hay transición (usa el comodín)"""
+        base = estado * self.n_simbolos
+        indice = self.indice_simbolo.get(simbolo)
+        if indice is not None and self.destinos[base + indice] >= 0:
+            return base + indice
+        if self.comodin >= 0 and self.destinos[base + self.comodin] >= 0:
+            return base + self.comodin
+        return None
+
+
+class AFDBinario(ModoAFD):
+    """AFD cargado desde un .simb; los estados son índices enteros"""
+    modo = "AFD"
+
+    def __init__(self, modelo):
+        self._modelo = modelo
+        self.alfabeto = modelo.meta.get("alfabeto", [])
+        self.simbolos = modelo.simbolos
+        self.estados = modelo.nombres
+        self.estado_inicial = modelo.inicial
+        self.transiciones = {}
+        self.entrada = ""
+        self.descripcion = modelo.meta.get("descripcion", "Sin descripción")
+
+    @property
+    def estados_finales(self):
+        return _Finales(self._modelo.finales, self._modelo.nombres)
+
+    def transicion(self, estado, simbolo):
+        celda = self._modelo.celda(estado, simbolo)
+        return None if celda is None else self._modelo.destinos[celda]
+
+    def es_final(self, estado):
+        return bool(self._modelo.finales[estado])
+
+    def _usa_comodin(self, estado, simbolo):
+        indice = self._modelo.indice_simbolo.get(simbolo)
+        return indice is None or self._modelo.destinos[estado * self._modelo.n_simbolos + indice] < 0
+
+    def _nombre_estado(self, estado):
+        return self._modelo.nombres[estado]
+
+
+class MTBinario(ModoMT):
+    """MT cargada desde un .simb; los estados son índices enteros"""
+    modo = "MT"
+
+    def __init__(self, modelo):
+        self._modelo = modelo
+        self.estados = modelo.nombres
+        self.estado_inicial = modelo.inicial
+        self.estados_finales = _Finales(modelo.finales, modelo.nombres)
+        self.entrada = ""
+        self.alfabeto = modelo.meta.get("alfabeto", [])
+        self.descripcion = modelo.meta.get("descripcion", "Sin descripción")
+        self.simbolo_blanco = modelo.simbolos[modelo.blanco]
+        self.max_pasos = modelo.max_pasos
+        self.checkpoint_ruta = None
+        self.checkpoint_cada = 0
+        self.reanudar_desde = None
+        self._reiniciar()
+
+    def _huella(self):
+        return hashlib.sha256(self._modelo._mapa).hexdigest()[:16]
+
+    def _buscar_transicion(self, estado, simbolo):
+        celda = self._modelo.celda(estado, simbolo)
+        if celda is None:
+            return None
+        return (
+            self._modelo.destinos[celda],
+            self._modelo.simbolos[self._modelo.escrituras[celda]],
+            chr(self._modelo.movimientos[celda]),
+        )
+
+    def _nombre_estado(self, estado):
+        return self._modelo.nombres[estado]
+
+    def _mostrar_transiciones(self):
+        # Listar millones de transiciones no aporta nada: solo el resumen
+        print("\n📐 TRANSICIONES:")
+        print("────────────────────────────────────────")
+        print(f"{self._modelo.n_estados} estados × {self._modelo.n_simbolos} símbolos (formato binario)")
+        print("────────────────────────────────────────\n")
+
+
+def _simbolos_tabla(*grupos):
+    simbolos = []
+    vistos = set()
+    for grupo in grupos:
+        for simbolo in grupo:
+            if simbolo not in vistos:
+                vistos.add(simbolo)
+                simbolos.append(simbolo)
+    return simbolos
+
+
+def _escribir(ruta, tipo, estados, simbolos, inicial, blanco, max_pasos, meta, finales, arreglos):
+    meta = dict(meta, simbolos=simbolos)
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+
+    nombres = [str(estado).encode("utf-8") for estado in estados]
+    desplazamientos = [0]
+    for nombre in nombres:
+        desplazamientos.append(desplazamientos[-1] + len(nombre))
+
+    def relleno(n):
+        return b"\0" * (_alinear(n) - n)
+
+    with open(ruta, "wb") as archivo:
+        archivo.write(_ENCABEZADO.pack(
+            MAGICO, VERSION, TIPOS[tipo], len(estados), len(simbolos),
+            inicial, blanco, max_pasos, len(meta_bytes)))
+        archivo.write(meta_bytes + relleno(_ENCABEZADO.size + len(meta_bytes)))
+        _escribir_enteros(archivo, desplazamientos)
+        archivo.write(b"".join(nombres) + relleno(desplazamientos[-1]))
+        archivo.write(bytes(finales) + relleno(len(finales)))
+        for arreglo in arreglos:
+            _escribir_enteros(archivo, arreglo)
+
+
+def _exportar_afd(data, ruta):
+    afd = ModoAFD(data)
+    estados = list(afd.estados)
+    indice = {estado: i for i, estado in enumerate(estados)}
+    simbolos = _simbolos_tabla(
+        afd.alfabeto, (s for trans in afd.transiciones.values() for s in trans))
+    columna = {s: i for i, s in enumerate(simbolos)}
+    m = len(simbolos)
+
+    destinos = array("i", [-1]) * (len(estados) * m)
+    for estado, trans in afd.transiciones.items():
+        base = indice[estado] * m
+        for simbolo, destino in trans.items():
+            destinos[base + columna[simbolo]] = indice[destino]
+
+    _escribir(ruta, "AFD", estados, simbolos, indice[afd.estado_inicial], -1, 0,
+              {"descripcion": afd.descripcion, "alfabeto": afd.alfabeto},
+              [1 if estado in afd._finales else 0 for estado in estados], [destinos])
+
+
+def _exportar_mt(data, ruta):
+    mt = ModoMT(data)
+    estados = list(mt.estados)
+    indice = {estado: i for i, estado in enumerate(estados)}
+    for (estado, _), (destino, _, _) in mt.transiciones.items():
+        for q in (estado, destino):
+            if q not in indice:
+                raise ValueError(f"❌ Estado '{q}' en transiciones no está definido en estados")
+    simbolos = _simbolos_tabla(
+        [mt.simbolo_blanco], mt.alfabeto,
+        (s for (_, s) in mt.transiciones),
+        (w for (_, w, _) in mt.transiciones.values()))
+    columna = {s: i for i, s in enumerate(simbolos)}
+    m = len(simbolos)
+
+    celdas = len(estados) * m
+    destinos = array("i", [-1]) * celdas
+    escrituras = array("i", [0]) * celdas
+    movimientos = array("i", [0]) * celdas
+    for (estado, simbolo), (destino, escribir, mover) in mt.transiciones.items():
+        celda = indice[estado] * m + columna[simbolo]
+        destinos[celda] = indice[destino]
+        escrituras[celda] = columna[escribir]
+        movimientos[celda] = ord(mover)
+
+    finales = set(mt.estados_finales)
+    _escribir(ruta, "MT", estados, simbolos, indice[mt.estado_inicial], columna[mt.simbolo_blanco],
+              mt.max_pasos, {"descripcion": mt.descripcion, "alfabeto": mt.alfabeto},
+              [1 if estado in finales else 0 for estado in estados],
+              [destinos, escrituras, movimientos])
+
+
+def exportar(data, ruta):
+    """Guarda una configuración AFD o MT (diccionario) en formato binario"""
+    modo = data.get("modo", "").upper()
+    if modo == "AFD":
+        _exportar_afd(data, ruta)
+    elif modo == "MT":
+        _exportar_mt(data, ruta)
+    else:
+        raise ValueError(f"❌ Solo se pueden exportar modelos AFD o MT (modo '{modo}')")
+
+
+def cargar(ruta):
+    """Carga un modelo .simb mediante mmap y retorna su simulador"""
+    modelo = _Modelo(ruta)
+    if modelo.tipo == "AFD":
+        return AFDBinario(modelo)
+    return MTBinario(modelo)
+
+
+def convertir(origen, destino):
+    """Convierte un archivo JSON de configuración (AFD o MT) a formato binario"""
+    exportar(cargar_configuracion(origen), destino)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Uso: python -m modos.binario entrada.json salida.simb")
+        sys.exit(2)
+
+    inicio = time.perf_counter()
+    try:
+        convertir(sys.argv[1], sys.argv[2])
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    print(f"💾 '{sys.argv[1]}' → '{sys.argv[2]}' en {time.perf_counter() - inicio:.2f} s")
@@ -0,0 +1,233 @@
+# modos/bosque_glc.py
+"""
+Bosque de análisis compartido y empaquetado (SPPF) para una GLC
+
+A partir de la tabla de análisis por tramos de ModoGLC se construye un
+grafo con todos los árboles de derivación de la cadena:
+- nodo de símbolo (A, i, j): A deriva entrada[i:j]; una alternativa por regla
+- nodo intermedio (A, k, d, i, j): los primeros d símbolos de la regla k
+  de A derivan entrada[i:j]; una alternativa por cada punto de corte
+
+Los nodos intermedios binarizan las reglas, así que el bosque tiene
+O(|G|·n³) alternativas aunque la cantidad de árboles sea exponencial.
+Los árboles se cuentan con programación dinámica sobre el bosque (enteros
+de precisión arbitraria) y se recorren de a uno con un iterador perezoso.
+Si el bosque tiene un ciclo (reglas unitarias o ε que se repiten), la
+cadena tiene infinitos árboles.
+"""
+from modos.glc import ModoGLC
+
+INFINITO = float("inf")
+
+
+class Bosque:
+    def __init__(self, gramatica, cadena):
+        """
+        gramatica: ModoGLC (se reutiliza su tabla de análisis)
+        alternativas[nodo] = lista de tuplas de hijos; un hijo es un nodo
+        (tupla) o un terminal (str)
+        """
+        self.gramatica = gramatica
+        self.cadena = cadena
+        self.raiz = (gramatica.simbolo_inicial, 0, len(cadena))
+        self.alternativas = {}
+
+        tabla = gramatica.actualizar_tabla(cadena)
+        if gramatica.simbolo_inicial in tabla[(0, len(cadena))].completos:
+            self._construir(tabla)
+
+    def _deriva(self, tabla, simbolo, m, j):
+        """¿El símbolo deriva cadena[m:j]?"""
+        if self.gramatica._es_terminal(simbolo):
+            return j == m + 1 and self.cadena[m] == simbolo
+        return simbolo in tabla[(m, j)].completos
+
+    def _alternativas(self, tabla, nodo):
+        if len(nodo) == 3:
+            no_terminal, i, j = nodo
+            return [
+                ((no_terminal, k, len(regla), i, j),)
+                for k, regla in enumerate(self.gramatica.reglas[no_terminal])
+                if (no_terminal, k, len(regla)) in tabla[(i, j)].items
+            ]
+
+        no_terminal, k, d, i, j = nodo
+        if d == 0:
+            return [()]
+        simbolo = self.gramatica.reglas[no_terminal][k][d - 1]
+        alternativas = []
+        for m in range(i, j + 1):
+            if (no_terminal, k, d - 1) in tabla[(i, m)].items and self._deriva(tabla, simbolo, m, j):
+                hijo = simbolo if self.gramatica._es_terminal(simbolo) else (simbolo, m, j)
+                alternativas.append(((no_terminal, k, d - 1, i, m), hijo))
+        return alternativas
+
+    def _construir(self, tabla):
+        """Agrega todos los nodos alcanzables desde la raíz"""
+        pila = [self.raiz]
+        while pila:
+            nodo = pila.pop()
+            if nodo in self.alternativas:
+                continue
+            self.alternativas[nodo] = self._alternativas(tabla, nodo)
+            for alternativa in self.alternativas[nodo]:
+                for hijo in alternativa:
+                    if isinstance(hijo, tuple) and hijo not in self.alternativas:
+                        pila.append(hijo)
+
+    def tamano(self):
+        """Retorna (nodos de símbolo, nodos intermedios, alternativas empaquetadas)"""
+        simbolos = sum(1 for nodo in self.alternativas if len(nodo) == 3)
+        alternativas = sum(len(alts) for alts in self.alternativas.values())
+        return simbolos, len(self.alternativas) - simbolos, alternativas
+
+    def contar_arboles(self):
+        """
+        Cantidad de árboles de derivación distintos (entero exacto),
+        0 si la cadena no pertenece e INFINITO si el bosque tiene un ciclo.
+        """
+        if not self.alternativas:
+            return 0
+
+        # DFS en postorden; un nodo "en proceso" alcanzado de nuevo es un ciclo
+        conteo = {}
+        en_proceso = set()
+        pila = [(self.raiz, False)]
+        while pila:
+            nodo, cerrar = pila.pop()
+            if cerrar:
+                total = 0
+                for alternativa in self.alternativas[nodo]:
+                    producto = 1
+                    for hijo in alternativa:
+                        if isinstance(hijo, tuple):
+                            producto *= conteo[hijo]
+                    total += producto
+                conteo[nodo] = total
+                en_proceso.discard(nodo)
+                continue
+            if nodo in conteo:
+                continue
+            if nodo in en_proceso:
+                return INFINITO
+            en_proceso.add(nodo)
+            pila.append((nodo, True))
+            for alternativa in self.alternativas[nodo]:
+                for hijo in alternativa:
+                    if isinstance(hijo, tuple) and hijo not in conteo:
+                        pila.append((hijo, False))
+        return conteo[self.raiz]
+
+    def es_ambigua(self):
+        """True si la cadena tiene más de un árbol de derivación"""
+        return self.contar_arboles() > 1
+
+    def nodos_ambiguos(self):
+        """Nodos con más de una alternativa: los puntos donde los árboles se separan"""
+        return [(nodo, len(alts)) for nodo, alts in self.alternativas.items() if len(alts) > 1]
+
+    def describir_nodo(self, nodo):
+        """Texto legible de un nodo del bosque"""
+        if len(nodo) == 3:
+            no_terminal, i, j = nodo
+            return f"{no_terminal} ⇒* '{self.cadena[i:j]}' [{i}, {j})"
+        no_terminal, k, d, i, j = nodo
+        regla = self.gramatica.reglas[no_terminal][k]
+        return f"{no_terminal} → {''.join(regla[:d])}·{''.join(regla[d:])} sobre '{self.cadena[i:j]}' [{i}, {j})"
+
+    def arboles(self):
+        """
+        Genera los árboles de derivación de a uno: (no_terminal, hijos),
+        donde cada hijo es un terminal o un subárbol. Si hay infinitos
+        árboles, solo se generan los que no repiten un nodo en una rama.
+        """
+        if self.alternativas:
+            yield from self._arboles_simbolo(self.raiz, frozenset())
+
+    def _arboles_simbolo(self, nodo, en_rama):
+        if nodo in en_rama:
+            return
+        en_rama = en_rama | {nodo}
+        for (item,) in self.alternativas[nodo]:
+            for hijos in self._arboles_item(item, en_rama):
+                yield (nodo[0], hijos)
+
+    def _arboles_item(self, item, en_rama):
+        for alternativa in self.alternativas[item]:
+            if not alternativa:
+                yield ()
+                continue
+            previo, hijo = alternativa
+            for prefijo in self._arboles_item(previo, en_rama):
+                if isinstance(hijo, str):
+                    yield prefijo + (hijo,)
+                else:
+                    for subarbol in self._arboles_simbolo(hijo, en_rama):
+                        yield prefijo + (subarbol,)
+
+
+def formatear_arbol(arbol):
+    """Árbol en notación de corchetes: [E [E a] + [E a]]"""
+    simbolo, hijos = arbol
+    if not hijos:
+        return f"[{simbolo} ε]"
+    partes = [hijo if isinstance(hijo, str) else formatear_arbol(hijo) for hijo in hijos]
+    return f"[{simbolo} {' '.join(partes)}]"
+
+
+class ModoBosqueGLC(ModoGLC):
+    def __init__(self, data):
+        super().__init__(data)
+        self.max_arboles = data.get("max_arboles", 5)
+
+    def bosque(self, cadena):
+        """Construye el bosque de análisis de la cadena"""
+        return Bosque(self, cadena)
+
+    def contar_arboles(self, cadena):
+        """Cantidad de árboles de derivación de la cadena (INFINITO si hay ciclos)"""
+        return self.bosque(cadena).contar_arboles()
+
+    def ejecutar(self):
+        """Construye el bosque, cuenta los árboles y reporta la ambigüedad"""
+        print(f"\n📝 Descripción: {self.descripcion}")
+        print(f"🎯 Símbolo inicial: {self.simbolo_inicial}")
+        print(f"📥 Cadena objetivo: '{self.entrada}' (longitud: {len(self.entrada)})")
+
+        self._mostrar_producciones()
+
+        bosque = self.bosque(self.entrada)
+        total = bosque.contar_arboles()
+
+        print(f"\n{'─'*50}")
+        if total == 0:
+            print("❌ La cadena NO pertenece al lenguaje")
+            return False
+
+        simbolos, intermedios, alternativas = bosque.tamano()
+        print("✅ La cadena PERTENECE al lenguaje generado por la GLC ✅")
+        print(f"🌲 Bosque: {simbolos} nodos de símbolo, {intermedios} intermedios, {alternativas} alternativas")
+
+        if total == INFINITO:
+            print("♾️  Árboles de derivación: infinitos (ciclo de reglas unitarias o ε)")
+        else:
+            print(f"🌳 Árboles de derivación: {total}")
+
+        if total == 1:
+            print("✔ La cadena NO es ambigua")
+        else:
+            print("⚠️  La cadena es AMBIGUA. Puntos de ambigüedad:")
+            ambiguos = bosque.nodos_ambiguos()
+            for nodo, cantidad in ambiguos[:10]:
+                print(f"   - {bosque.describir_nodo(nodo)}: {cantidad} alternativas")
+            if len(ambiguos) > 10:
+                print(f"   ... y {len(ambiguos) - 10} más")
+
+        print(f"\n{'─'*50}")
+        print(f"Primeros {self.max_arboles} árboles:")
+        print(f"{'─'*50}")
+        for n, arbol in enumerate(bosque.arboles(), 1):
+            if n > self.max_arboles:
+                break
+            print(f"  {n}. {formatear_arbol(arbol)}")
+        return True
@@ -0,0 +1,235 @@
+# modos/diferencial.py
+"""
+Pruebas diferenciales entre modelos declarados equivalentes
+
+Recibe varias configuraciones que deberían reconocer el mismo lenguaje
+(por ejemplo una GLC y un AP para a^n b^n), genera entradas y las procesa
+por lotes en todos los motores:
+- casos borde: ε, todas las cadenas cortas y repeticiones de un símbolo
+- cadenas del lenguaje muestreadas de los modelos que son gramáticas
+  (las cadenas al azar casi nunca pertenecen a lenguajes como a^n b^n)
+- cadenas al azar sobre el alfabeto común
+
+Cada desacuerdo se reduce con delta debugging (ddmin) a un contraejemplo
+mínimo, y se mide el rendimiento de cada motor en cadenas por segundo.
+
+Uso desde la línea de comandos (código de salida 0 si todos coinciden):
+    python -m modos.diferencial a.json b.json [...] [--casos N]
+"""
+import itertools
+import os
+import random
+import sys
+import time
+
+from modos import registro
+from utils.helpers import cargar_configuracion
+
+
+def cargar_modelo(referencia):
+    """Construye un simulador desde un archivo JSON, un .simb o una configuración en línea"""
+    if isinstance(referencia, str) and referencia.endswith(".simb"):
+        from modos import binario
+        ruta = referencia if os.path.isfile(referencia) else os.path.join("ejemplos", referencia)
+        return binario.cargar(ruta)
+    if isinstance(referencia, str):
+        referencia = cargar_configuracion(referencia)
+    if not isinstance(referencia, dict):
+        raise ValueError(f"❌ Referencia de modelo no válida: {referencia!r}")
+    modelo = registro.compilar(referencia)
+    if not hasattr(modelo, "acepta"):
+        raise ValueError(f"❌ El modo '{referencia.get('modo')}' no admite ejecución por lotes")
+    return modelo
+
+
+def _muestras_del_lenguaje(modelos, max_longitud, cantidad, semilla):
+    """Cadenas del lenguaje tomadas de los modelos que son gramáticas"""
+    from modos.enumeracion import muestrear
+    from modos.glc import ModoGLC
+    from modos.gramatica_regular import ModoGramaticaRegular
+
+    muestras = []
+    for modelo in modelos:
+        if not isinstance(modelo, (ModoGLC, ModoGramaticaRegular)):
+            continue
+        for longitud in range(max_longitud + 1):
+            muestras += muestrear(modelo, longitud, cantidad, semilla)
+    return muestras
+
+
+def generar_entradas(alfabeto, cantidad, max_longitud, semilla=None, modelos=()):
+    """
+    Retorna la lista de entradas de prueba sin repetidos: casos borde,
+    cadenas del lenguaje y 'cantidad' cadenas al azar.
+    """
+    rng = random.Random(semilla)
+    entradas = [""]
+
+    # Todas las cadenas cortas (hasta 3000 aprox.)
+    for longitud in range(1, max_longitud + 1):
+        if len(alfabeto) ** longitud > 3000:
+            break
+        entradas += ["".join(t) for t in itertools.product(alfabeto, repeat=longitud)]
+    for simbolo in alfabeto:
+        entradas += [simbolo * longitud for longitud in range(1, max_longitud + 1)]
+
+    entradas += _muestras_del_lenguaje(modelos, max_longitud, 3, semilla)
+
+    for _ in range(cantidad):
+        longitud = rng.randint(0, max_longitud)
+        entradas.append("".join(rng.choice(alfabeto) for _ in range(longitud)))
+
+    return list(dict.fromkeys(entradas))
+
+
+def minimizar(cadena, falla):
+    """
+    Delta debugging (ddmin): reduce la cadena eliminando fragmentos
+    mientras 'falla' siga siendo verdadero. Retorna una cadena 1-mínima.
+    """
+    simbolos = list(cadena)
+    n = 2
+    while len(simbolos) >= 2:
+        tamano = -(-len(simbolos) // n)
+        partes = [simbolos[i:i + tamano] for i in range(0, len(simbolos), tamano)]
+
+        reducido = False
+        # Probar cada fragmento y luego cada complemento
+        for parte in partes:
+            if falla("".join(parte)):
+                simbolos, n, reducido = parte, 2, True
+                break
+        if not reducido:
+            for i in range(len(partes)):
+                resto = [s for j, parte in enumerate(partes) if j != i for s in parte]
+                if falla("".join(resto)):
+                    simbolos, n, reducido = resto, max(n - 1, 2), True
+                    break
+        if not reducido:
+            if n >= len(simbolos):
+                break
+            n = min(n * 2, len(simbolos))
+
+    if len(simbolos) == 1 and falla(""):
+        simbolos = []
+    return "".join(simbolos)
+
+
+def comparar(modelos, entradas):
+    """
+    Procesa las entradas por lotes en cada modelo.
+    Retorna: (resultados por modelo, segundos por modelo)
+    """
+    resultados = []
+    tiempos = []
+    for modelo in modelos:
+        inicio = time.perf_counter()
+        resultados.append(registro.ejecutar_lote(modelo, entradas))
+        tiempos.append(time.perf_counter() - inicio)
+    return resultados, tiempos
+
+
+def _difieren(modelos, cadena):
+    return len({modelo.acepta(cadena) for modelo in modelos}) > 1
+
+
+class ModoDiferencial:
+    def __init__(self, data):
+        self.referencias = data.get("modelos", [])
+        self.alfabeto = data.get("alfabeto")
+        self.casos = data.get("casos", 500)
+        self.max_longitud = data.get("max_longitud", 10)
+        self.semilla = data.get("semilla")
+        self.max_mostrar = data.get("max_mostrar", 5)
+        self.entrada = data.get("entrada", "")
+        self.descripcion = data.get("descripcion", "Sin descripción")
+
+        # Validar configuración
+        if len(self.referencias) < 2:
+            raise ValueError("❌ Se necesitan al menos dos modelos para comparar")
+
+        self.modelos = [cargar_modelo(referencia) for referencia in self.referencias]
+        self.nombres = [
+            referencia if isinstance(referencia, str) else f"{referencia.get('modo', '?')} #{i}"
+            for i, referencia in enumerate(self.referencias, 1)
+        ]
+
+        if not self.alfabeto:
+            self.alfabeto = []
+            for modelo in self.modelos:
+                for simbolo in getattr(modelo, "alfabeto", []):
+                    if simbolo not in self.alfabeto and simbolo != "*":
+                        self.alfabeto.append(simbolo)
+        if not self.alfabeto:
+            raise ValueError("❌ No se pudo deducir el alfabeto: defínelo en 'alfabeto'")
+
+    def acepta(self, cadena):
+        """True si todos los modelos coinciden sobre la cadena"""
+        return not _difieren(self.modelos, cadena)
+
+    def ejecutar(self):
+        """Compara los modelos, muestra los desacuerdos minimizados y el rendimiento"""
+        # La entrada, si es un número, reemplaza la cantidad de casos al azar
+        if str(self.entrada).isdigit():
+            self.casos = int(self.entrada)
+
+        print(f"\n📝 Descripción: {self.descripcion}")
+        print("🧩 Modelos:")
+        for nombre, modelo in zip(self.nombres, self.modelos):
+            print(f"   - {nombre} ({type(modelo).__name__})")
+        print(f"🔤 Alfabeto: {', '.join(self.alfabeto)}")
+
+        entradas = generar_entradas(self.alfabeto, self.casos, self.max_longitud,
+                                    self.semilla, self.modelos)
+        print(f"📥 Entradas generadas: {len(entradas)} (longitud máxima {self.max_longitud})")
+
+        resultados, tiempos = comparar(self.modelos, entradas)
+
+        desacuerdos = [
+            k for k in range(len(entradas))
+            if len({resultado[k] for resultado in resultados}) > 1
+        ]
+        aceptadas = sum(resultados[0])
+
+        print(f"\n{'─'*50}")
+        print("Rendimiento por motor:")
+        print(f"{'─'*50}")
+        for nombre, segundos in zip(self.nombres, tiempos):
+            por_segundo = len(entradas) / segundos if segundos else float("inf")
+            print(f"  {nombre}: {segundos:.4f} s ({por_segundo:,.0f} cadenas/s)")
+
+        print(f"\n{'─'*50}")
+        print(f"✅ Aceptadas por {self.nombres[0]}: {aceptadas} de {len(entradas)}")
+        if not desacuerdos:
+            print(f"✅ Todos los modelos coinciden en las {len(entradas)} entradas ✅")
+            return True
+
+        print(f"❌ {len(desacuerdos)} entradas con desacuerdo")
+        contraejemplos = []
+        for k in desacuerdos:
+            minima = minimizar(entradas[k], lambda cadena: _difieren(self.modelos, cadena))
+            if minima not in contraejemplos:
+                contraejemplos.append(minima)
+            if len(contraejemplos) >= self.max_mostrar:
+                break
+
+        for minima in sorted(contraejemplos, key=lambda c: (len(c), c)):
+            print(f"\n🧪 Contraejemplo mínimo: '{minima if minima else 'ε'}'")
+            for nombre, modelo in zip(self.nombres, self.modelos):
+                print(f"   {nombre}: {'ACEPTA' if modelo.acepta(minima) else 'RECHAZA'}")
+        return False
+
+
+if __name__ == "__main__":
+    argumentos = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    casos = 500
+    if "--casos" in sys.argv:
+        indice = sys.argv.index("--casos")
+        casos = int(sys.argv[indice + 1])
+        argumentos.remove(sys.argv[indice + 1])
+    if len(argumentos) < 2:
+        print("Uso: python -m modos.diferencial a.json b.json [...] [--casos N]")
+        sys.exit(2)
+
+    modo = ModoDiferencial({"modelos": argumentos, "casos": casos})
+    sys.exit(0 if modo.ejecutar() else 1)
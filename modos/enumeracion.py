@@ -0,0 +1,332 @@
+# modos/enumeracion.py
+"""
+Enumera, cuenta y muestrea las cadenas de una gramática (GLC o regular)
+
+- enumerar: genera las cadenas en orden por longitud y luego lexicográfico,
+  sin repetidos y de forma perezosa (memoria acotada por la longitud,
+  no por la cantidad de cadenas)
+- contar: cuántas cadenas hay de cada longitud (programación dinámica)
+- muestrear: una cadena uniforme al azar entre las de una longitud
+
+Gramática regular: se trabaja sobre el AFD equivalente, así que los
+conteos son exactos y el muestreo es directo.
+
+GLC: la enumeración poda cada prefijo con la tabla de análisis usando
+comodines (¿existe una cadena de longitud n que empiece así?). El conteo
+cuenta árboles de derivación de la gramática propia equivalente (sin ε ni
+reglas unitarias), que coincide con el número de cadenas si la gramática
+no es ambigua. El muestreo es uniforme sobre cadenas en cualquier caso:
+se muestrea un árbol y se acepta con probabilidad 1 / (árboles de la cadena).
+"""
+import random
+
+from modos import registro
+from modos.glc import ModoGLC, COMODIN
+from modos.gramatica_regular import ModoGramaticaRegular
+from utils.helpers import cargar_configuracion
+
+
+class _EnumeradorRegular:
+    def __init__(self, gramatica):
+        self.transiciones, self.finales, self.simbolos = gramatica.construir_afd()
+        # conteos[k][q] = cadenas de longitud k aceptadas desde el estado q
+        self.conteos = [[1 if q in self.finales else 0 for q in range(len(self.transiciones))]]
+
+    def _conteo(self, estado, longitud):
+        while len(self.conteos) <= longitud:
+            anterior = self.conteos[-1]
+            self.conteos.append([
+                sum(anterior[destino] for destino in trans.values())
+                for trans in self.transiciones
+            ])
+        return self.conteos[longitud][estado]
+
+    def contar(self, longitud):
+        return self._conteo(0, longitud)
+
+    def enumerar(self, max_longitud):
+        for n in range(max_longitud + 1):
+            if self._conteo(0, n) == 0:
+                continue
+            # DFS en orden lexicográfico: pila de (estado, símbolos pendientes)
+            prefijo = []
+            pila = [(0, iter(self.simbolos))]
+            while pila:
+                estado, pendientes = pila[-1]
+                if len(prefijo) == n:
+                    yield "".join(prefijo)
+                    pila.pop()
+                    if prefijo:
+                        prefijo.pop()
+                    continue
+                for simbolo in pendientes:
+                    destino = self.transiciones[estado].get(simbolo)
+                    if destino is not None and self._conteo(destino, n - len(prefijo) - 1):
+                        prefijo.append(simbolo)
+                        pila.append((destino, iter(self.simbolos)))
+                        break
+                else:
+                    pila.pop()
+                    if prefijo:
+                        prefijo.pop()
+
+    def muestrear(self, longitud, rng):
+        if self._conteo(0, longitud) == 0:
+            return None
+        estado = 0
+        cadena = []
+        for restante in range(longitud, 0, -1):
+            objetivo = rng.randrange(self._conteo(estado, restante))
+            for simbolo, destino in sorted(self.transiciones[estado].items()):
+                peso = self._conteo(destino, restante - 1)
+                if objetivo < peso:
+                    cadena.append(simbolo)
+                    estado = destino
+                    break
+                objetivo -= peso
+        return "".join(cadena)
+
+
+class _EnumeradorGLC:
+    def __init__(self, gramatica):
+        self.gramatica = gramatica
+        self.inicial = gramatica.simbolo_inicial
+        self.terminales = gramatica.terminales()
+        self.reglas, self.genera_vacia = gramatica.gramatica_propia()
+        self._arboles = {}
+        self._formas = {}
+
+    def _es_terminal(self, simbolo):
+        return simbolo not in self.reglas
+
+    def _existe(self, patron):
+        """¿Hay alguna cadena del lenguaje que coincida con el patrón?"""
+        tabla = self.gramatica.actualizar_tabla(patron)
+        return self.inicial in tabla[(0, len(patron))].completos
+
+    def enumerar(self, max_longitud):
+        if self.genera_vacia:
+            yield ""
+        for n in range(1, max_longitud + 1):
+            if not self._existe([COMODIN] * n):
+                continue
+            prefijo = []
+            pila = [iter(self.terminales)]
+            while pila:
+                if len(prefijo) == n:
+                    yield "".join(prefijo)
+                    pila.pop()
+                    prefijo.pop()
+                    continue
+                for simbolo in pila[-1]:
+                    patron = prefijo + [simbolo] + [COMODIN] * (n - len(prefijo) - 1)
+                    if self._existe(patron):
+                        prefijo.append(simbolo)
+                        pila.append(iter(self.terminales))
+                        break
+                else:
+                    pila.pop()
+                    if prefijo:
+                        prefijo.pop()
+
+    def _contar_arboles(self, no_terminal, longitud):
+        """Árboles de derivación de no_terminal con exactamente 'longitud' terminales"""
+        clave = (no_terminal, longitud)
+        if clave not in self._arboles:
+            self._arboles[clave] = sum(
+                self._contar_formas(regla, 0, longitud)
+                for regla in self.reglas[no_terminal]
+            )
+        return self._arboles[clave]
+
+    def _contar_formas(self, regla, t, longitud):
+        """Formas en que regla[t:] deriva cadenas de exactamente 'longitud' terminales"""
+        if t == len(regla):
+            return 1 if longitud == 0 else 0
+        clave = (regla, t, longitud)
+        if clave in self._formas:
+            return self._formas[clave]
+
+        # Cada símbolo restante produce al menos un terminal
+        maximo = longitud - (len(regla) - t - 1)
+        simbolo = regla[t]
+        if self._es_terminal(simbolo):
+            total = self._contar_formas(regla, t + 1, longitud - 1) if maximo >= 1 else 0
+        else:
+            total = sum(
+                self._contar_arboles(simbolo, x) * self._contar_formas(regla, t + 1, longitud - x)
+                for x in range(1, maximo + 1)
+            )
+        self._formas[clave] = total
+        return total
+
+    def contar(self, longitud):
+        if longitud == 0:
+            return 1 if self.genera_vacia else 0
+        return self._contar_arboles(self.inicial, longitud)
+
+    def _muestrear_arbol(self, no_terminal, longitud, rng, salida):
+        """Muestrea un árbol uniforme y escribe sus terminales en 'salida'"""
+        objetivo = rng.randrange(self._contar_arboles(no_terminal, longitud))
+        for regla in self.reglas[no_terminal]:
+            peso = self._contar_formas(regla, 0, longitud)
+            if objetivo < peso:
+                break
+            objetivo -= peso
+
+        restante = longitud
+        for t, simbolo in enumerate(regla):
+            if self._es_terminal(simbolo):
+                salida.append(simbolo)
+                restante -= 1
+                continue
+            # Elegir cuántos terminales produce este símbolo
+            objetivo = rng.randrange(self._contar_formas(regla, t, restante))
+            for x in range(1, restante + 1):
+                peso = self._contar_arboles(simbolo, x) * self._contar_formas(regla, t + 1, restante - x)
+                if objetivo < peso:
+                    break
+                objetivo -= peso
+            self._muestrear_arbol(simbolo, x, rng, salida)
+            restante -= x
+
+    def _arboles_de(self, cadena):
+        """Cantidad de árboles de la gramática propia que generan la cadena"""
+        memo = {}
+
+        def formas(regla, t, i, j):
+            if t == len(regla):
+                return 1 if i == j else 0
+            clave = (regla, t, i, j)
+            if clave in memo:
+                return memo[clave]
+            simbolo = regla[t]
+            if self._es_terminal(simbolo):
+                total = formas(regla, t + 1, i + 1, j) if i < j and cadena[i] == simbolo else 0
+            else:
+                total = sum(
+                    arboles(simbolo, i, m) * formas(regla, t + 1, m, j)
+                    for m in range(i + 1, j - (len(regla) - t - 1) + 1)
+                )
+            memo[clave] = total
+            return total
+
+        def arboles(no_terminal, i, j):
+            return sum(formas(regla, 0, i, j) for regla in self.reglas[no_terminal])
+
+        return arboles(self.inicial, 0, len(cadena))
+
+    def muestrear(self, longitud, rng):
+        if self.contar(longitud) == 0:
+            return None
+        if longitud == 0:
+            return ""
+        while True:
+            salida = []
+            self._muestrear_arbol(self.inicial, longitud, rng, salida)
+            cadena = "".join(salida)
+            # Corrección por ambigüedad: uniforme sobre cadenas, no sobre árboles
+            if rng.random() * self._arboles_de(cadena) < 1:
+                return cadena
+
+
+def _enumerador(gramatica):
+    if isinstance(gramatica, ModoGramaticaRegular):
+        return _EnumeradorRegular(gramatica)
+    if isinstance(gramatica, ModoGLC):
+        return _EnumeradorGLC(gramatica)
+    raise ValueError("❌ Solo se pueden enumerar gramáticas GLC o GRAMATICA_REGULAR")
+
+
+def enumerar(gramatica, max_longitud):
+    """Genera perezosamente las cadenas de longitud ≤ max_longitud en orden por longitud y lexicográfico"""
+    return _enumerador(gramatica).enumerar(max_longitud)
+
+
+def contar(gramatica, max_longitud):
+    """Retorna la lista de conteos para las longitudes 0..max_longitud"""
+    enumerador = _enumerador(gramatica)
+    return [enumerador.contar(n) for n in range(max_longitud + 1)]
+
+
+def muestrear(gramatica, longitud, cantidad=1, semilla=None):
+    """Retorna 'cantidad' cadenas uniformes de la longitud dada (vacío si no hay ninguna)"""
+    enumerador = _enumerador(gramatica)
+    rng = random.Random(semilla)
+    muestras = []
+    for _ in range(cantidad):
+        cadena = enumerador.muestrear(longitud, rng)
+        if cadena is None:
+            break
+        muestras.append(cadena)
+    return muestras
+
+
+class ModoEnumeracion:
+    def __init__(self, data):
+        self.referencia = data.get("gramatica")
+        self.max_longitud = data.get("max_longitud", 6)
+        self.max_mostrar = data.get("max_mostrar", 50)
+        self.muestras = data.get("muestras", 0)
+        self.semilla = data.get("semilla")
+        self.archivo_salida = data.get("archivo_salida")
+        self.entrada = data.get("entrada", "")
+        self.descripcion = data.get("descripcion", "Sin descripción")
+
+        # Validar configuración
+        if not self.referencia:
+            raise ValueError("❌ Falta definir la gramática a enumerar")
+
+        config = self.referencia
+        if isinstance(config, str):
+            config = cargar_configuracion(config)
+        self.gramatica = registro.compilar(config)
+        if not isinstance(self.gramatica, (ModoGLC, ModoGramaticaRegular)):
+            raise ValueError("❌ Solo se pueden enumerar gramáticas GLC o GRAMATICA_REGULAR")
+
+    def ejecutar(self):
+        """Muestra los conteos por longitud, las primeras cadenas y muestras aleatorias"""
+        # La entrada, si es un número, reemplaza la longitud máxima
+        if str(self.entrada).isdigit():
+            self.max_longitud = int(self.entrada)
+
+        print(f"\n📝 Descripción: {self.descripcion}")
+        print(f"📐 Gramática: {self.referencia}")
+        print(f"📏 Longitud máxima: {self.max_longitud}")
+
+        print(f"\n{'─'*50}")
+        if isinstance(self.gramatica, ModoGLC):
+            print("Árboles de derivación por longitud (= cadenas si la GLC no es ambigua):")
+        else:
+            print("Cadenas por longitud:")
+        print(f"{'─'*50}")
+        conteos = contar(self.gramatica, self.max_longitud)
+        for n, total in enumerate(conteos):
+            print(f"  |w| = {n}: {total}")
+
+        print(f"\n{'─'*50}")
+        print(f"Primeras {self.max_mostrar} cadenas:")
+        print(f"{'─'*50}")
+        archivo = open(self.archivo_salida, "w", encoding="utf-8") if self.archivo_salida else None
+        total = 0
+        try:
+            for cadena in enumerar(self.gramatica, self.max_longitud):
+                if total < self.max_mostrar:
+                    print(f"  {cadena if cadena else 'ε'}")
+                if archivo:
+                    archivo.write(cadena + "\n")
+                elif total >= self.max_mostrar:
+                    break
+                total += 1
+        finally:
+            if archivo:
+                archivo.close()
+        if archivo:
+            print(f"\n💾 {total} cadenas escritas en '{self.archivo_salida}'")
+
+        if self.muestras:
+            print(f"\n{'─'*50}")
+            print(f"Muestras uniformes de longitud {self.max_longitud}:")
+            print(f"{'─'*50}")
+            for cadena in muestrear(self.gramatica, self.max_longitud, self.muestras, self.semilla):
+                print(f"  {cadena if cadena else 'ε'}")
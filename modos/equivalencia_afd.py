@@ -0,0 +1,209 @@
+# modos/equivalencia_afd.py
+"""
+Verifica equivalencia e inclusión de lenguajes entre dos AFDs
+
+Usa el algoritmo de Hopcroft-Karp: recorre en amplitud los pares de
+estados alcanzables (p, q) y los une en una estructura union-find.
+Un par cuyos estados ya están en la misma clase no se vuelve a explorar,
+por lo que el recorrido es casi lineal en el número de estados.
+
+Al recorrer en amplitud, el primer par con aceptación distinta da la
+cadena distinguidora MÁS CORTA.
+
+La inclusión L(A) ⊆ L(B) se reduce a la equivalencia L(A ∪ B) = L(B)
+usando el autómata producto perezoso.
+
+Uso desde la línea de comandos (código de salida 0 si se cumple):
+    python -m modos.equivalencia_afd a.json b.json [--inclusion]
+"""
+import sys
+import time
+from collections import deque
+
+from modos.producto_afd import cargar_automata, union
+
+
+def _candidatos(automata):
+    """
+    Símbolos que usa un autómata: su alfabeto y los de sus transiciones.
+    Los autómatas producto no tienen transiciones propias: se recorren
+    sus componentes.
+    """
+    candidatos = list(automata.alfabeto) + list(getattr(automata, "simbolos", []))
+    for trans in getattr(automata, "transiciones", {}).values():
+        candidatos += list(trans)
+    for componente in getattr(automata, "componentes", []):
+        candidatos += _candidatos(componente)
+    return candidatos
+
+
+def _simbolos(a, b):
+    """
+    Alfabeto común de ambos autómatas. Si alguno usa el comodín '*',
+    se agrega un símbolo nuevo que representa "cualquier otro símbolo".
+    """
+    simbolos = []
+    comodin = False
+    for automata in (a, b):
+        for simbolo in _candidatos(automata):
+            if simbolo == "*":
+                comodin = True
+            elif simbolo not in simbolos:
+                simbolos.append(simbolo)
+
+    if comodin:
+        codigo = 0xE000
+        while chr(codigo) in simbolos:
+            codigo += 1
+        simbolos.append(chr(codigo))
+    return simbolos
+
+
+def _paso(automata, estado, simbolo):
+    """Transición tratando None como el estado sumidero"""
+    return None if estado is None else automata.transicion(estado, simbolo)
+
+
+def _final(automata, estado):
+    return estado is not None and automata.es_final(estado)
+
+
+def _buscar(padre, x):
+    """Find con compresión de caminos"""
+    raiz = x
+    while padre.get(raiz, raiz) != raiz:
+        raiz = padre[raiz]
+    while x != raiz:
+        x, padre[x] = padre[x], raiz
+    return raiz
+
+
+def son_equivalentes(a, b, simbolos=None):
+    """
+    Verifica si L(A) = L(B). 'simbolos' reemplaza el alfabeto que se
+    recorre (por defecto, todos los símbolos que usan A y B).
+    Retorna: (equivalentes: bool, contraejemplo: str o None)
+    """
+    if simbolos is None:
+        simbolos = _simbolos(a, b)
+
+    inicial = (a.estado_inicial, b.estado_inicial)
+    if _final(a, inicial[0]) != _final(b, inicial[1]):
+        return False, ""
+
+    # Los estados se etiquetan con su autómata para que no se confundan
+    padre = {}
+    tamano = {}
+    padre[("A", inicial[0])] = ("B", inicial[1])
+    tamano[("B", inicial[1])] = 2
+
+    # origen[par] = (par_anterior, símbolo) para reconstruir la cadena
+    origen = {inicial: None}
+    cola = deque([inicial])
+
+    while cola:
+        par = cola.popleft()
+        p, q = par
+        for simbolo in simbolos:
+            p2 = _paso(a, p, simbolo)
+            q2 = _paso(b, q, simbolo)
+
+            raiz_p = _buscar(padre, ("A", p2))
+            raiz_q = _buscar(padre, ("B", q2))
+            if raiz_p == raiz_q:
+                continue
+
+            # Unión por tamaño
+            if tamano.get(raiz_p, 1) < tamano.get(raiz_q, 1):
+                raiz_p, raiz_q = raiz_q, raiz_p
+            padre[raiz_q] = raiz_p
+            tamano[raiz_p] = tamano.get(raiz_p, 1) + tamano.get(raiz_q, 1)
+
+            nuevo = (p2, q2)
+            origen[nuevo] = (par, simbolo)
+            if _final(a, p2) != _final(b, q2):
+                return False, _reconstruir(origen, nuevo)
+            cola.append(nuevo)
+
+    return True, None
+
+
+def esta_incluido(a, b):
+    """
+    Verifica si L(A) ⊆ L(B).
+    Retorna: (incluido: bool, contraejemplo: str o None)
+    El contraejemplo es la cadena más corta aceptada por A y rechazada por B.
+    """
+    return son_equivalentes(union(a, b), b, _simbolos(a, b))
+
+
+def _reconstruir(origen, par):
+    """Reconstruye la cadena siguiendo los pares anteriores"""
+    simbolos = []
+    while origen[par] is not None:
+        par, simbolo = origen[par]
+        simbolos.append(simbolo)
+    return "".join(reversed(simbolos))
+
+
+class ModoEquivalenciaAFD:
+    def __init__(self, data):
+        self.referencia_a = data.get("automata_a")
+        self.referencia_b = data.get("automata_b")
+        self.relacion = data.get("relacion", "equivalencia").lower()
+        self.descripcion = data.get("descripcion", "Sin descripción")
+        self.entrada = data.get("entrada", "")
+
+        # Validar configuración
+        if not self.referencia_a or not self.referencia_b:
+            raise ValueError("❌ Faltan definir 'automata_a' y 'automata_b'")
+        if self.relacion not in ("equivalencia", "inclusion"):
+            raise ValueError(f"❌ Relación '{self.relacion}' no reconocida. Relaciones válidas: equivalencia, inclusion")
+
+        self.automata_a = cargar_automata(self.referencia_a)
+        self.automata_b = cargar_automata(self.referencia_b)
+
+    def verificar(self):
+        """Retorna (se_cumple, contraejemplo) según la relación configurada"""
+        if self.relacion == "inclusion":
+            return esta_incluido(self.automata_a, self.automata_b)
+        return son_equivalentes(self.automata_a, self.automata_b)
+
+    def ejecutar(self):
+        """Ejecuta la verificación y muestra el contraejemplo si existe"""
+        simbolo_relacion = "⊆" if self.relacion == "inclusion" else "="
+
+        print(f"\n📝 Descripción: {self.descripcion}")
+        print(f"🅰️  Autómata A: {self.referencia_a}")
+        print(f"🅱️  Autómata B: {self.referencia_b}")
+        print(f"🔍 Verificando: L(A) {simbolo_relacion} L(B)")
+
+        inicio = time.perf_counter()
+        se_cumple, contraejemplo = self.verificar()
+        duracion = time.perf_counter() - inicio
+
+        print(f"\n{'─'*50}")
+        if se_cumple:
+            print(f"✅ Se cumple L(A) {simbolo_relacion} L(B) ✅")
+        else:
+            mostrar = contraejemplo if contraejemplo else "ε"
+            print(f"❌ NO se cumple L(A) {simbolo_relacion} L(B)")
+            print(f"🧪 Contraejemplo más corto: '{mostrar}'")
+            print(f"   A: {'ACEPTA' if self.automata_a.acepta(contraejemplo) else 'RECHAZA'}")
+            print(f"   B: {'ACEPTA' if self.automata_b.acepta(contraejemplo) else 'RECHAZA'}")
+        print(f"⏱️  Tiempo: {duracion:.4f} s")
+        return se_cumple
+
+
+if __name__ == "__main__":
+    argumentos = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if len(argumentos) != 2:
+        print("Uso: python -m modos.equivalencia_afd a.json b.json [--inclusion]")
+        sys.exit(2)
+
+    modo = ModoEquivalenciaAFD({
+        "automata_a": argumentos[0],
+        "automata_b": argumentos[1],
+        "relacion": "inclusion" if "--inclusion" in sys.argv else "equivalencia",
+    })
+    sys.exit(0 if modo.ejecutar() else 1)
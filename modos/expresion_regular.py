@@ -0,0 +1,357 @@
+# modos/expresion_regular.py
+"""
+Simula una Expresión Regular compilándola a un AFD mínimo
+
+La expresión se compila en tres pasos:
+1. Construcción de Thompson (expresión → AFN con transiciones ε)
+2. Construcción de subconjuntos (AFN → AFD)
+3. Minimización de Hopcroft (AFD → AFD mínimo)
+
+El resultado tiene la misma estructura que un JSON de modo AFD y se
+ejecuta con ModoAFD. Las tablas compiladas se guardan en caché.
+
+Sintaxis soportada:
+- a        símbolo literal
+- ab       concatenación
+- a|b      unión
+- a*       cero o más repeticiones
+- a+       una o más repeticiones
+- a?       opcional
+- (a|b)    agrupación
+- .        cualquier símbolo del alfabeto
+- ε        cadena vacía
+- \\+      escapa un carácter especial
+
+El símbolo '*' no puede ser literal ni formar parte del alfabeto: en un
+AFD la transición '*' es el comodín de ModoAFD.
+"""
+from modos.afd import ModoAFD
+
+ESPECIALES = set("|*+?().\\")
+EPSILON = "ε"
+COMODIN = "*"
+
+# Caché de tablas compiladas: (expresión, alfabeto) → configuración AFD
+_cache_compilado = {}
+
+
+class _ParserRegex:
+    """
+    Analizador descendente recursivo que construye el AFN de Thompson.
+
+    Cada fragmento es un par (inicio, fin) de estados del AFN.
+    """
+
+    def __init__(self, expresion, alfabeto):
+        self.expresion = expresion
+        self.alfabeto = alfabeto
+        self.pos = 0
+        # transiciones_eps[estado] = [destinos]
+        self.transiciones_eps = []
+        # transiciones_sim[estado] = [(símbolo, destino)]
+        self.transiciones_sim = []
+
+    def _nuevo_estado(self):
+        self.transiciones_eps.append([])
+        self.transiciones_sim.append([])
+        return len(self.transiciones_eps) - 1
+
+    def _actual(self):
+        return self.expresion[self.pos] if self.pos < len(self.expresion) else None
+
+    def parsear(self):
+        fragmento = self._union()
+        if self.pos < len(self.expresion):
+            raise ValueError(f"❌ Carácter inesperado '{self._actual()}' en la posición {self.pos}")
+        return fragmento
+
+    def _union(self):
+        inicio, fin = self._concatenacion()
+        while self._actual() == "|":
+            self.pos += 1
+            otro_inicio, otro_fin = self._concatenacion()
+            nuevo_inicio, nuevo_fin = self._nuevo_estado(), self._nuevo_estado()
+            self.transiciones_eps[nuevo_inicio] += [inicio, otro_inicio]
+            self.transiciones_eps[fin].append(nuevo_fin)
+            self.transiciones_eps[otro_fin].append(nuevo_fin)
+            inicio, fin = nuevo_inicio, nuevo_fin
+        return inicio, fin
+
+    def _concatenacion(self):
+        # Una concatenación vacía representa ε
+        inicio = fin = self._nuevo_estado()
+        while self._actual() is not None and self._actual() not in "|)":
+            sub_inicio, sub_fin = self._repeticion()
+            self.transiciones_eps[fin].append(sub_inicio)
+            fin = sub_fin
+        return inicio, fin
+
+    def _repeticion(self):
+        inicio, fin = self._atomo()
+        while self._actual() is not None and self._actual() in "*+?":
+            operador = self._actual()
+            self.pos += 1
+            nuevo_inicio, nuevo_fin = self._nuevo_estado(), self._nuevo_estado()
+            self.transiciones_eps[nuevo_inicio].append(inicio)
+            self.transiciones_eps[fin].append(nuevo_fin)
+            if operador in "*?":
+                self.transiciones_eps[nuevo_inicio].append(nuevo_fin)
+            if operador in "*+":
+                self.transiciones_eps[fin].append(inicio)
+            inicio, fin = nuevo_inicio, nuevo_fin
+        return inicio, fin
+
+    def _atomo(self):
+        caracter = self._actual()
+        if caracter is None:
+            raise ValueError("❌ La expresión termina de forma inesperada")
+
+        if caracter == "(":
+            self.pos += 1
+            fragmento = self._union()
+            if self._actual() != ")":
+                raise ValueError(f"❌ Falta ')' en la posición {self.pos}")
+            self.pos += 1
+            return fragmento
+
+        if caracter in "*+?)|":
+            raise ValueError(f"❌ Operador '{caracter}' sin operando en la posición {self.pos}")
+
+        self.pos += 1
+        inicio, fin = self._nuevo_estado(), self._nuevo_estado()
+
+        if caracter == EPSILON:
+            self.transiciones_eps[inicio].append(fin)
+        elif caracter == ".":
+            for simbolo in self.alfabeto:
+                self.transiciones_sim[inicio].append((simbolo, fin))
+        else:
+            if caracter == "\\":
+                caracter = self._actual()
+                if caracter is None:
+                    raise ValueError("❌ Escape '\\' al final de la expresión")
+                self.pos += 1
+            self.transiciones_sim[inicio].append((caracter, fin))
+        return inicio, fin
+
+
+def _simbolos_literales(expresion):
+    """Obtiene los símbolos literales usados en la expresión, en orden de aparición"""
+    simbolos = []
+    i = 0
+    while i < len(expresion):
+        caracter = expresion[i]
+        if caracter == "\\" and i + 1 < len(expresion):
+            caracter = expresion[i + 1]
+            i += 1
+        elif caracter in ESPECIALES or caracter == EPSILON:
+            i += 1
+            continue
+        if caracter not in simbolos:
+            simbolos.append(caracter)
+        i += 1
+    return simbolos
+
+
+def _cerradura_epsilon(estados, transiciones_eps):
+    """Calcula la cerradura-ε de un conjunto de estados del AFN"""
+    pila = list(estados)
+    cerradura = set(estados)
+    while pila:
+        estado = pila.pop()
+        for destino in transiciones_eps[estado]:
+            if destino not in cerradura:
+                cerradura.add(destino)
+                pila.append(destino)
+    return frozenset(cerradura)
+
+
+def _subconjuntos(parser, inicio, fin, alfabeto):
+    """
+    Construcción de subconjuntos.
+    Retorna un AFD completo: (transiciones, finales) con estados enteros
+    y el estado 0 como inicial. Incluye el estado sumidero si hace falta.
+    """
+    inicial = _cerradura_epsilon([inicio], parser.transiciones_eps)
+    indices = {inicial: 0}
+    pendientes = [inicial]
+    transiciones = []
+    finales = set()
+
+    while pendientes:
+        conjunto = pendientes.pop()
+        indice = indices[conjunto]
+        while len(transiciones) <= indice:
+            transiciones.append({})
+        if fin in conjunto:
+            finales.add(indice)
+
+        for simbolo in alfabeto:
+            destinos = [
+                destino
+                for estado in conjunto
+                for (s, destino) in parser.transiciones_sim[estado]
+                if s == simbolo
+            ]
+            siguiente = _cerradura_epsilon(destinos, parser.transiciones_eps)
+            if siguiente not in indices:
+                indices[siguiente] = len(indices)
+                pendientes.append(siguiente)
+            transiciones[indice][simbolo] = indices[siguiente]
+
+    while len(transiciones) < len(indices):
+        transiciones.append({})
+    return transiciones, finales
+
+
+def _minimizar(transiciones, finales, alfabeto):
+    """
+    Minimización de Hopcroft sobre un AFD completo.
+    Retorna la lista de clases de equivalencia y el índice de clase de cada estado.
+    """
+    total = len(transiciones)
+    no_finales = set(range(total)) - finales
+    particion = [bloque for bloque in (set(finales), no_finales) if bloque]
+    pendientes = [set(bloque) for bloque in particion]
+
+    # Transiciones inversas: inversas[símbolo][destino] = {orígenes}
+    inversas = {simbolo: {} for simbolo in alfabeto}
+    for origen, trans in enumerate(transiciones):
+        for simbolo, destino in trans.items():
+            inversas[simbolo].setdefault(destino, set()).add(origen)
+
+    while pendientes:
+        divisor = pendientes.pop()
+        for simbolo in alfabeto:
+            predecesores = set()
+            for destino in divisor:
+                predecesores |= inversas[simbolo].get(destino, set())
+            if not predecesores:
+                continue
+
+            nueva_particion = []
+            for bloque in particion:
+                dentro = bloque & predecesores
+                fuera = bloque - predecesores
+                if dentro and fuera:
+                    nueva_particion += [dentro, fuera]
+                    if bloque in pendientes:
+                        pendientes.remove(bloque)
+                        pendientes += [dentro, fuera]
+                    else:
+                        pendientes.append(dentro if len(dentro) <= len(fuera) else fuera)
+                else:
+                    nueva_particion.append(bloque)
+            particion = nueva_particion
+
+    clase_de = {}
+    for indice, bloque in enumerate(particion):
+        for estado in bloque:
+            clase_de[estado] = indice
+    return particion, clase_de
+
+
+def compilar_expresion(expresion, alfabeto=None):
+    """
+    Compila una expresión regular a la configuración de un AFD mínimo.
+
+    Retorna un diccionario con las claves "alfabeto", "estados",
+    "estado_inicial", "estados_finales" y "transiciones", igual que un
+    JSON de modo AFD. El estado sumidero se omite: ModoAFD rechaza
+    cuando no encuentra transición.
+    """
+    if alfabeto is None:
+        alfabeto = _simbolos_literales(expresion)
+    clave = (expresion, tuple(alfabeto))
+    if clave in _cache_compilado:
+        return _cache_compilado[clave]
+
+    if "." in expresion.replace("\\.", "") and not alfabeto:
+        raise ValueError("❌ El comodín '.' requiere definir el alfabeto")
+
+    literales = _simbolos_literales(expresion)
+    if COMODIN in literales or COMODIN in alfabeto:
+        raise ValueError(f"❌ '{COMODIN}' no puede ser un símbolo literal: ModoAFD lo usa como comodín")
+    fuera = [simbolo for simbolo in literales if simbolo not in alfabeto]
+    if fuera:
+        raise ValueError(f"❌ Los símbolos {', '.join(repr(s) for s in fuera)} no están en el alfabeto")
+
+    parser = _ParserRegex(expresion, alfabeto)
+    inicio, fin = parser.parsear()
+    transiciones, finales = _subconjuntos(parser, inicio, fin, alfabeto)
+    particion, clase_de = _minimizar(transiciones, finales, alfabeto)
+
+    # Una clase es sumidero si no es final y todas sus transiciones vuelven a ella
+    sumideros = set()
+    for indice, bloque in enumerate(particion):
+        representante = next(iter(bloque))
+        if representante in finales:
+            continue
+        if all(clase_de[destino] == indice for destino in transiciones[representante].values()):
+            sumideros.add(indice)
+
+    # Renombrar las clases en orden BFS desde el estado inicial: q0, q1, ...
+    nombres = {}
+    cola = [clase_de[0]]
+    nombres[clase_de[0]] = "q0"
+    tabla = {}
+    i = 0
+    while i < len(cola):
+        clase = cola[i]
+        i += 1
+        representante = next(iter(particion[clase]))
+        fila = {}
+        for simbolo in alfabeto:
+            destino = clase_de[transiciones[representante][simbolo]]
+            if destino in sumideros:
+                continue
+            if destino not in nombres:
+                nombres[destino] = f"q{len(nombres)}"
+                cola.append(destino)
+            fila[simbolo] = nombres[destino]
+        if fila:
+            tabla[nombres[clase]] = fila
+
+    compilado = {
+        "alfabeto": list(alfabeto),
+        "estados": [nombres[clase] for clase in cola],
+        "estado_inicial": "q0",
+        "estados_finales": [
+            nombres[clase] for clase in cola
+            if next(iter(particion[clase])) in finales
+        ],
+        "transiciones": tabla,
+    }
+    _cache_compilado[clave] = compilado
+    return compilado
+
+
+class ModoExpresionRegular(ModoAFD):
+    def __init__(self, data):
+        self.expresion = data.get("expresion")
+        if self.expresion is None:
+            raise ValueError("❌ Falta definir la expresión regular")
+
+        compilado = compilar_expresion(self.expresion, data.get("alfabeto"))
+
+        data_afd = dict(data)
+        data_afd.update(compilado)
+        super().__init__(data_afd)
+
+    def _mostrar_tabla(self):
+        """Muestra la tabla de transiciones del AFD mínimo"""
+        print("\n📐 AFD mínimo compilado:")
+        print("─" * 50)
+        for estado in self.estados:
+            marca = "*" if estado in self.estados_finales else " "
+            trans = self.transiciones.get(estado, {})
+            fila = ", ".join(f"'{s}' → {d}" for s, d in trans.items())
+            print(f" {marca}{estado}: {fila if fila else '(sin transiciones)'}")
+        print("─" * 50)
+
+    def ejecutar(self):
+        """Ejecuta la simulación de la expresión regular sobre su AFD mínimo"""
+        print(f"\n🔤 Expresión regular: {self.expresion}")
+        print(f"🔢 Estados del AFD mínimo: {len(self.estados)}")
+        self._mostrar_tabla()
+        super().ejecutar()
@@ -4,8 +4,40 @@ Simula una Gramática Libre de Contexto (GLC)
 
 Intenta derivar la cadena de entrada desde el símbolo inicial,
 mostrando todos los pasos de derivación.
+
+Si la gramática es LL(1) se usa un analizador predictivo con tabla
+(FIRST/FOLLOW) en tiempo lineal; si no, una tabla de análisis por
+tramos que se conserva entre entradas: al editar la cadena solo se
+recalculan las celdas que cubren la zona modificada.
 """
 
+from utils.busqueda import BusquedaDerivacion
+
+# Marca de fin de cadena para FOLLOW y la tabla LL(1)
+FIN_CADENA = "$"
+
+# En los patrones de construir_tabla, coincide con cualquier terminal
+COMODIN = None
+
+
+class _Tramo:
+    """
+    Celda de la tabla de análisis para un tramo [i, j) de la entrada.
+
+    - items[(A, k, d)] = m: los primeros d símbolos de la regla k de A
+      derivan el tramo; el símbolo d empieza m posiciones después de i
+      (relativo, para poder desplazar la celda tras una edición)
+    - completos[A] = k: A deriva el tramo usando su regla k
+    - espera[X] = items que necesitan el símbolo X a continuación
+    """
+    __slots__ = ("items", "completos", "espera")
+
+    def __init__(self):
+        self.items = {}
+        self.completos = {}
+        self.espera = {}
+
+
 class ModoGLC:
     def __init__(self, data):
         self.producciones = data.get("producciones", {})
@@ -14,12 +46,28 @@ class ModoGLC:
         self.alfabeto = data.get("alfabeto", [])
         self.descripcion = data.get("descripcion", "Sin descripción")
         self.max_pasos = data.get("max_pasos", 100)
+        self.max_nodos = data.get("max_nodos", 100000)
         
         # Para rastrear la derivación exitosa
         self.ruta_exitosa = []
+        self.producciones_aplicadas = []
         
         # Validar configuración
         self._validar_configuracion()
+        
+        # Producciones como tuplas de símbolos (ε → tupla vacía)
+        self.reglas = {
+            no_terminal: [self._simbolos_produccion(prod) for prod in prods]
+            for no_terminal, prods in self.producciones.items()
+        }
+        
+        # Tabla LL(1) calculada bajo demanda: (tabla, conflictos)
+        self._analisis_ll1 = None
+        
+        # Tabla de análisis de la última entrada, para reutilizarla
+        self._tabla = None
+        self._patron = None
+        self.celdas_recalculadas = 0
     
     def _validar_configuracion(self):
         """Valida que la configuración de la GLC sea correcta"""
@@ -45,64 +93,449 @@ class ModoGLC:
                 return True
         return False
     
-    def derivar(self, actual, objetivo, pasos=0, historial=None, visitados=None):
+    def derivar(self, actual, objetivo):
         """
-        Intenta derivar la cadena objetivo desde la cadena actual.
-        Retorna True si tiene éxito, guardando la ruta en self.ruta_exitosa
+        Busca una derivación por la izquierda de la cadena objetivo desde la
+        forma sentencial actual. Retorna True si tiene éxito, guardando la
+        ruta en self.ruta_exitosa y las producciones en self.producciones_aplicadas.
+        
+        La frontera guarda solo punteros al padre (ver utils/busqueda.py) y
+        pasa a profundización iterativa al superar max_nodos formas.
         """
-        if historial is None:
-            historial = [actual]
-        if visitados is None:
-            visitados = set()
+        actual = actual.replace("epsilon", "").replace("ε", "")
+        anulables = self.calcular_anulables()
         
-        # Manejar epsilon (cadena vacía)
-        actual_procesada = actual.replace("ε", "").replace("epsilon", "")
+        def expandir(forma):
+            # Derivación por la izquierda: solo se expande el primer no-terminal
+            i = next((k for k, simbolo in enumerate(forma) if not self._es_terminal(simbolo)), None)
+            if i is None:
+                return
+            simbolo = forma[i]
+            for regla in self.reglas[simbolo]:
+                produccion = "".join(regla)
+                nueva = forma[:i] + produccion + forma[i+1:]
+                
+                # Poda: los terminales antes del primer no-terminal ya no cambian
+                j = next((k for k, s in enumerate(nueva) if not self._es_terminal(s)), len(nueva))
+                if nueva[:j] != objetivo[:j]:
+                    continue
+                if j == len(nueva) and nueva != objetivo:
+                    continue
+                
+                # Poda: cada terminal y cada no-terminal no anulable aporta al menos un símbolo
+                minimo = sum(1 for s in nueva if self._es_terminal(s) or s not in anulables)
+                if minimo > len(objetivo):
+                    continue
+                
+                yield nueva, f"{simbolo} → {produccion if produccion else 'ε'}"
         
-        # Caso base: se logró derivar el objetivo
-        if actual_procesada == objetivo:
-            self.ruta_exitosa = historial.copy()
-            return True
+        self.busqueda = BusquedaDerivacion(expandir, self.max_pasos, self.max_nodos)
+        exito, formas, producciones = self.busqueda.buscar(actual, objetivo)
+        if exito:
+            self.ruta_exitosa = formas
+            self.producciones_aplicadas = producciones
+        return exito
+    
+    def _simbolos_produccion(self, produccion):
+        """Convierte una producción en tupla de símbolos, eliminando ε"""
+        return tuple(produccion.replace("epsilon", "").replace("ε", ""))
+    
+    def calcular_anulables(self):
+        """Calcula el conjunto de no-terminales que derivan ε"""
+        anulables = set()
+        cambio = True
+        while cambio:
+            cambio = False
+            for no_terminal, reglas in self.reglas.items():
+                if no_terminal in anulables:
+                    continue
+                if any(all(s in anulables for s in regla) for regla in reglas):
+                    anulables.add(no_terminal)
+                    cambio = True
+        return anulables
+    
+    def _primeros_secuencia(self, secuencia, primeros, anulables):
+        """
+        Calcula FIRST de una secuencia de símbolos.
+        Retorna: (conjunto de terminales, la secuencia es anulable)
+        """
+        resultado = set()
+        for simbolo in secuencia:
+            if self._es_terminal(simbolo):
+                resultado.add(simbolo)
+                return resultado, False
+            resultado |= primeros[simbolo]
+            if simbolo not in anulables:
+                return resultado, False
+        return resultado, True
+    
+    def calcular_primeros(self, anulables=None):
+        """Calcula FIRST de cada no-terminal (punto fijo)"""
+        if anulables is None:
+            anulables = self.calcular_anulables()
+        primeros = {no_terminal: set() for no_terminal in self.reglas}
+        cambio = True
+        while cambio:
+            cambio = False
+            for no_terminal, reglas in self.reglas.items():
+                for regla in reglas:
+                    nuevos, _ = self._primeros_secuencia(regla, primeros, anulables)
+                    if not nuevos <= primeros[no_terminal]:
+                        primeros[no_terminal] |= nuevos
+                        cambio = True
+        return primeros
+    
+    def calcular_siguientes(self, primeros=None, anulables=None):
+        """Calcula FOLLOW de cada no-terminal (punto fijo). FIN_CADENA marca el final"""
+        if anulables is None:
+            anulables = self.calcular_anulables()
+        if primeros is None:
+            primeros = self.calcular_primeros(anulables)
+        siguientes = {no_terminal: set() for no_terminal in self.reglas}
+        siguientes[self.simbolo_inicial].add(FIN_CADENA)
+        cambio = True
+        while cambio:
+            cambio = False
+            for no_terminal, reglas in self.reglas.items():
+                for regla in reglas:
+                    for i, simbolo in enumerate(regla):
+                        if self._es_terminal(simbolo):
+                            continue
+                        nuevos, anulable = self._primeros_secuencia(regla[i+1:], primeros, anulables)
+                        if anulable:
+                            nuevos |= siguientes[no_terminal]
+                        if not nuevos <= siguientes[simbolo]:
+                            siguientes[simbolo] |= nuevos
+                            cambio = True
+        return siguientes
+    
+    def construir_tabla_ll1(self):
+        """
+        Construye la tabla de análisis predictivo LL(1).
+        Retorna: (tabla, conflictos)
+        - tabla[(no_terminal, terminal)] = índice de la producción
+        - conflictos: lista de (no_terminal, terminal, [producciones en conflicto])
+        La gramática es LL(1) si no hay conflictos.
+        """
+        if self._analisis_ll1 is not None:
+            return self._analisis_ll1
         
-        # Detectar bucles: si ya visitamos esta configuración
-        estado = (actual_procesada, pasos)
-        if estado in visitados:
-            return False
-        visitados.add(estado)
+        anulables = self.calcular_anulables()
+        primeros = self.calcular_primeros(anulables)
+        siguientes = self.calcular_siguientes(primeros, anulables)
         
-        # Límite de pasos para evitar bucles infinitos
-        if pasos >= self.max_pasos:
-            return False
+        candidatos = {}
+        for no_terminal, reglas in self.reglas.items():
+            for indice, regla in enumerate(reglas):
+                terminales, anulable = self._primeros_secuencia(regla, primeros, anulables)
+                if anulable:
+                    terminales = terminales | siguientes[no_terminal]
+                for terminal in terminales:
+                    candidatos.setdefault((no_terminal, terminal), []).append(indice)
         
-        # Poda: si la cadena actual es más larga que el objetivo y solo tiene terminales
-        if not self._tiene_no_terminales(actual_procesada) and actual_procesada != objetivo:
+        tabla = {}
+        conflictos = []
+        for (no_terminal, terminal), indices in candidatos.items():
+            tabla[(no_terminal, terminal)] = indices[0]
+            if len(indices) > 1:
+                prods = [self.producciones[no_terminal][i] for i in indices]
+                conflictos.append((no_terminal, terminal, prods))
+        
+        self._analisis_ll1 = (tabla, conflictos)
+        return self._analisis_ll1
+    
+    def es_ll1(self):
+        """Verifica si la gramática es LL(1)"""
+        return not self.construir_tabla_ll1()[1]
+    
+    def derivar_ll1(self, objetivo):
+        """
+        Análisis predictivo LL(1) con pila explícita, en tiempo lineal.
+        Retorna True si tiene éxito, guardando la derivación por la
+        izquierda en self.ruta_exitosa (misma salida que derivar)
+        """
+        tabla, _ = self.construir_tabla_ll1()
+        
+        # La cima de la pila es el último elemento
+        pila = [self.simbolo_inicial]
+        consumido = []
+        historial = [self.simbolo_inicial]
+        idx = 0
+        
+        while pila:
+            simbolo = pila.pop()
+            actual = objetivo[idx] if idx < len(objetivo) else FIN_CADENA
+            
+            if self._es_terminal(simbolo):
+                if simbolo != actual:
+                    return False
+                consumido.append(simbolo)
+                idx += 1
+                continue
+            
+            indice = tabla.get((simbolo, actual))
+            if indice is None:
+                return False
+            
+            regla = self.reglas[simbolo][indice]
+            pila.extend(reversed(regla))
+            historial.append("".join(consumido) + "".join(reversed(pila)))
+        
+        if idx != len(objetivo):
             return False
         
-        # Poda adicional: si ya es muy larga
-        if len(actual_procesada) > len(objetivo) * 2:
+        self.ruta_exitosa = historial
+        return True
+    
+    def terminales(self):
+        """Terminales que aparecen en las producciones, en orden lexicográfico"""
+        return sorted({
+            simbolo
+            for reglas in self.reglas.values()
+            for regla in reglas
+            for simbolo in regla
+            if self._es_terminal(simbolo)
+        })
+    
+    def _agregar_item(self, tramo, item, corte):
+        """Agrega un item al tramo. Retorna True si es nuevo"""
+        if item in tramo.items:
             return False
+        tramo.items[item] = corte
+        no_terminal, k, d = item
+        regla = self.reglas[no_terminal][k]
+        if d == len(regla):
+            tramo.completos.setdefault(no_terminal, k)
+        else:
+            tramo.espera.setdefault(regla[d], []).append(item)
+        return True
+    
+    def _combinar(self, tramo, izquierda, derecha, patron, i, m, j):
+        """
+        Avanza los items de 'izquierda' (tramo [i, m)) con los símbolos
+        que derivan [m, j) según 'derecha'. Retorna True si agregó algo.
+        """
+        nuevos = False
+        simbolos = list(derecha.completos)
+        if j == m + 1:
+            if patron[m] is COMODIN:
+                simbolos += [x for x in izquierda.espera if self._es_terminal(x)]
+            else:
+                simbolos.append(patron[m])
+        for simbolo in simbolos:
+            for no_terminal, k, d in list(izquierda.espera.get(simbolo, ())):
+                if self._agregar_item(tramo, (no_terminal, k, d + 1), m - i):
+                    nuevos = True
+        return nuevos
+    
+    def _calcular_tramo(self, tabla, patron, i, j):
+        """Calcula la celda [i, j) a partir de los tramos más cortos"""
+        tramo = _Tramo()
+        tabla[(i, j)] = tramo
+        
+        if i == j:
+            # Items con el punto al inicio de cada regla
+            for no_terminal, reglas in self.reglas.items():
+                for k in range(len(reglas)):
+                    self._agregar_item(tramo, (no_terminal, k, 0), 0)
+        
+        # Cortes interiores: dependen solo de tramos ya calculados
+        for m in range(i + 1, j):
+            self._combinar(tramo, tabla[(i, m)], tabla[(m, j)], patron, i, m, j)
+        
+        # Los cortes en los extremos dependen del propio tramo: punto fijo
+        cambio = True
+        while cambio:
+            cambio = self._combinar(tramo, tabla[(i, i)], tabla[(i, j)], patron, i, i, j)
+            if j > i:
+                cambio = self._combinar(tramo, tramo, tabla[(j, j)], patron, i, j, j) or cambio
+        return tramo
+    
+    def _completar_tabla(self, tabla, patron):
+        """Calcula las celdas que faltan en la tabla, de menor a mayor longitud"""
+        n = len(patron)
+        for longitud in range(n + 1):
+            for i in range(n - longitud + 1):
+                if (i, i + longitud) not in tabla:
+                    self._calcular_tramo(tabla, patron, i, i + longitud)
+                    self.celdas_recalculadas += 1
+        return tabla
+    
+    def construir_tabla(self, patron):
+        """
+        Tabla de análisis por tramos (CYK generalizado a producciones
+        arbitrarias, con ε y reglas unitarias), en tiempo O(n³).
+        
+        patron: cadena o lista de símbolos; COMODIN coincide con cualquier terminal.
+        Retorna: dict (i, j) → _Tramo
+        """
+        return self._completar_tabla({}, patron)
+    
+    def actualizar_tabla(self, patron):
+        """
+        Retorna la tabla para el patrón reutilizando la de la entrada anterior.
+        
+        La diferencia con el patrón anterior se toma como una sola edición
+        (prefijo y sufijo comunes). Cada celda depende solo de su tramo, así
+        que las celdas a la izquierda de la edición se conservan y las de la
+        derecha se desplazan; solo se recalculan las que cubren la edición.
+        """
+        patron = list(patron)
+        self.celdas_recalculadas = 0
+        if self._tabla is None:
+            self._tabla = self.construir_tabla(patron)
+            self._patron = patron
+            return self._tabla
         
-        # Contar no-terminales para priorizar expansiones
-        num_no_terminales = sum(1 for c in actual if not self._es_terminal(c))
+        anterior = self._patron
+        limite = min(len(anterior), len(patron))
+        prefijo = 0
+        while prefijo < limite and anterior[prefijo] == patron[prefijo]:
+            prefijo += 1
+        sufijo = 0
+        while sufijo < limite - prefijo and anterior[-1 - sufijo] == patron[-1 - sufijo]:
+            sufijo += 1
         
-        # Poda: si hay demasiados no-terminales, probablemente no lleguemos
-        if num_no_terminales > len(objetivo):
+        return self.editar_tabla(prefijo, len(anterior) - prefijo - sufijo,
+                                 patron[prefijo:len(patron) - sufijo])
+    
+    def editar_tabla(self, posicion, eliminar, insertar):
+        """
+        Aplica una edición a la última entrada analizada: elimina 'eliminar'
+        símbolos desde 'posicion' e inserta los de 'insertar' (un reemplazo
+        es ambas cosas). Retorna la tabla de la entrada editada.
+        """
+        if self._tabla is None:
+            raise ValueError("❌ No hay una tabla previa para editar")
+        anterior = self._patron
+        if posicion < 0 or posicion + eliminar > len(anterior):
+            raise ValueError(f"❌ Edición fuera de la cadena (longitud {len(anterior)})")
+        
+        patron = anterior[:posicion] + list(insertar) + anterior[posicion + eliminar:]
+        fin_anterior = posicion + eliminar
+        desplazamiento = len(insertar) - eliminar
+        
+        tabla = {}
+        for (i, j), tramo in self._tabla.items():
+            if j <= posicion:
+                tabla[(i, j)] = tramo
+            elif i >= fin_anterior:
+                tabla[(i + desplazamiento, j + desplazamiento)] = tramo
+        
+        self.celdas_recalculadas = 0
+        self._tabla = self._completar_tabla(tabla, patron)
+        self._patron = patron
+        return self._tabla
+    
+    def editar(self, posicion, eliminar=0, insertar=""):
+        """
+        Edita la entrada actual (insertar, eliminar o reemplazar desde
+        'posicion') reutilizando la tabla. Retorna True si la cadena
+        editada pertenece al lenguaje.
+        """
+        if self._patron is None or "".join(self._patron) != self.entrada:
+            self.actualizar_tabla(self.entrada)
+        tabla = self.editar_tabla(posicion, eliminar, insertar)
+        self.entrada = "".join(self._patron)
+        return self.simbolo_inicial in tabla[(0, len(self.entrada))].completos
+    
+    def acepta(self, cadena):
+        """Verifica la pertenencia sin imprimir nada, reutilizando la tabla anterior"""
+        tabla = self.actualizar_tabla(cadena)
+        return self.simbolo_inicial in tabla[(0, len(cadena))].completos
+    
+    def _hijos(self, tabla, no_terminal, i, j):
+        """
+        Hijos del nodo (no_terminal, i, j) según la tabla: lista de
+        terminales y nodos (no_terminal, i, j), de izquierda a derecha
+        """
+        k = tabla[(i, j)].completos[no_terminal]
+        regla = self.reglas[no_terminal][k]
+        hijos = []
+        fin = j
+        for d in range(len(regla), 0, -1):
+            inicio = i + tabla[(i, fin)].items[(no_terminal, k, d)]
+            simbolo = regla[d - 1]
+            hijos.append(simbolo if self._es_terminal(simbolo) else (simbolo, inicio, fin))
+            fin = inicio
+        hijos.reverse()
+        return hijos
+    
+    def derivar_tabla(self, objetivo):
+        """
+        Busca la derivación usando la tabla de análisis (tiempo polinomial).
+        Retorna True si tiene éxito, guardando la derivación por la
+        izquierda en self.ruta_exitosa (misma salida que derivar)
+        """
+        tabla = self.actualizar_tabla(objetivo)
+        if self.simbolo_inicial not in tabla[(0, len(objetivo))].completos:
             return False
         
-        # Intentar reemplazar cada no-terminal en la cadena
-        # Estrategia: expandir de izquierda a derecha
-        for i, simbolo in enumerate(actual):
-            if simbolo in self.producciones:
-                # Probar cada producción posible
-                for produccion in self.producciones[simbolo]:
-                    # Construir nueva cadena
-                    nueva = actual[:i] + produccion + actual[i+1:]
-                    
-                    # Recursión con historial actualizado
-                    nuevo_historial = historial + [nueva]
-                    if self.derivar(nueva, objetivo, pasos + 1, nuevo_historial, visitados):
-                        return True
+        # Forma sentencial: terminales y nodos pendientes de expandir
+        forma = [(self.simbolo_inicial, 0, len(objetivo))]
+        historial = [self.simbolo_inicial]
+        posicion = 0
+        while True:
+            while posicion < len(forma) and isinstance(forma[posicion], str):
+                posicion += 1
+            if posicion == len(forma):
+                break
+            forma[posicion:posicion + 1] = self._hijos(tabla, *forma[posicion])
+            historial.append("".join(x if isinstance(x, str) else x[0] for x in forma))
         
-        return False
+        self.ruta_exitosa = historial
+        return True
+    
+    def gramatica_propia(self):
+        """
+        Gramática equivalente sin reglas ε ni reglas unitarias (A → B),
+        en la que cada símbolo deriva al menos un terminal.
+        Retorna: (reglas, genera_vacia)
+        - reglas: dict no_terminal → lista de tuplas de símbolos (sin repetir)
+        - genera_vacia: si ε pertenece al lenguaje
+        """
+        anulables = self.calcular_anulables()
+        
+        # Eliminar ε: variantes que omiten no-terminales anulables
+        sin_epsilon = {}
+        for no_terminal, reglas in self.reglas.items():
+            variantes = set()
+            for regla in reglas:
+                parciales = [()]
+                for simbolo in regla:
+                    parciales = [p + (simbolo,) for p in parciales] + (
+                        parciales if simbolo in anulables else []
+                    )
+                variantes.update(p for p in parciales if p)
+            sin_epsilon[no_terminal] = variantes
+        
+        # Eliminar reglas unitarias con la cerradura A ⇒* B
+        propias = {}
+        for no_terminal in sin_epsilon:
+            alcanzados = {no_terminal}
+            pila = [no_terminal]
+            while pila:
+                actual = pila.pop()
+                for regla in sin_epsilon[actual]:
+                    if len(regla) == 1 and not self._es_terminal(regla[0]) and regla[0] not in alcanzados:
+                        alcanzados.add(regla[0])
+                        pila.append(regla[0])
+            reglas = set()
+            for destino in alcanzados:
+                reglas.update(
+                    regla for regla in sin_epsilon[destino]
+                    if not (len(regla) == 1 and not self._es_terminal(regla[0]))
+                )
+            propias[no_terminal] = sorted(reglas)
+        
+        return propias, self.simbolo_inicial in anulables
+    
+    def _mostrar_conflictos(self, conflictos):
+        """Muestra los conflictos que impiden el análisis LL(1)"""
+        print("\n⚠️  La gramática NO es LL(1). Conflictos en la tabla:")
+        for no_terminal, terminal, prods in conflictos:
+            prods_mostrar = " | ".join(p if p not in ["epsilon", "ε", ""] else "ε" for p in prods)
+            print(f"  M[{no_terminal}, '{terminal}'] = {prods_mostrar}")
     
     def _mostrar_producciones(self):
         """Muestra todas las producciones de la gramática"""
@@ -126,12 +559,27 @@ class ModoGLC:
         # Reiniciar ruta exitosa
         self.ruta_exitosa = []
         
+        # Usar el análisis LL(1) si la gramática lo permite
+        _, conflictos = self.construir_tabla_ll1()
+        usar_ll1 = not conflictos
+        
         print(f"\n{'─'*50}")
-        print("Buscando derivación...")
+        if usar_ll1:
+            print("Gramática LL(1): análisis predictivo en tiempo lineal...")
+        else:
+            self._mostrar_conflictos(conflictos)
+            print("Buscando derivación con la tabla de análisis...")
         print(f"{'─'*50}")
         
         # Intentar derivar
-        if self.derivar(self.simbolo_inicial, self.entrada):
+        if usar_ll1:
+            encontrada = self.derivar_ll1(self.entrada)
+        else:
+            encontrada = self.derivar_tabla(self.entrada)
+            total_celdas = (len(self.entrada) + 1) * (len(self.entrada) + 2) // 2
+            print(f"📊 Celdas recalculadas: {self.celdas_recalculadas} de {total_celdas}")
+        
+        if encontrada:
             print("\n✅ La cadena PERTENECE al lenguaje generado por la GLC ✅")
             print(f"\n🔍 Derivación encontrada ({len(self.ruta_exitosa)} pasos):")
             print("─" * 50)
@@ -151,4 +599,7 @@ class ModoGLC:
             print("─" * 50)
         else:
             print(f"\n❌ La cadena NO pertenece al lenguaje")
-            print(f"   (Se alcanzó el límite de {self.max_pasos} pasos sin encontrar derivación)")
\ No newline at end of file
+            if usar_ll1:
+                print(f"   (El análisis LL(1) no encontró una producción aplicable)")
+            else:
+                print(f"   (Ninguna derivación desde '{self.simbolo_inicial}' genera la cadena)")
\ No newline at end of file
@@ -9,7 +9,7 @@ Las gramáticas regulares tienen producciones de la forma:
 
 NOTA: Para epsilon usa "epsilon", "eps", "e", "ε" o "" (cadena vacía)
 """
-from collections import deque
+from utils.busqueda import BusquedaDerivacion
 
 class ModoGramaticaRegular:
     
@@ -20,10 +20,12 @@ class ModoGramaticaRegular:
         self.alfabeto = data.get("alfabeto", [])
         self.descripcion = data.get("descripcion", "Sin descripción")
         self.max_pasos = data.get("max_pasos", 200)
+        self.max_nodos = data.get("max_nodos", 100000)
         self.epsilon_simbolos = ["epsilon", "eps", "e", "", "ε"]
         
         # Para rastrear la derivación exitosa
         self.ruta_exitosa = []
+        self.producciones_aplicadas = []
         
         # Validar configuración
         self._validar_configuracion()
@@ -49,60 +51,141 @@ class ModoGramaticaRegular:
         """Verifica si un símbolo es terminal (no está en producciones)"""
         return simbolo not in self.producciones
     
+    def construir_afd(self):
+        """
+        Convierte la gramática lineal derecha en un AFD por construcción
+        de subconjuntos (solo los subconjuntos alcanzables).
+        
+        Retorna: (transiciones, finales, simbolos)
+        - transiciones[estado] = {símbolo: estado}, con 0 como estado inicial
+        - finales: conjunto de estados de aceptación
+        - simbolos: terminales en orden lexicográfico
+        """
+        # AFN: los estados son los no-terminales, estados intermedios y FINAL
+        FINAL = ("FINAL",)
+        epsilon = {}
+        simbolo_trans = {}
+        simbolos = set()
+        
+        for no_terminal, prods in self.producciones.items():
+            for produccion in prods:
+                if self.es_epsilon(produccion):
+                    epsilon.setdefault(no_terminal, []).append(FINAL)
+                    continue
+                
+                terminales, destino = produccion, FINAL
+                if produccion[-1] in self.producciones:
+                    terminales, destino = produccion[:-1], produccion[-1]
+                for simbolo in terminales:
+                    if simbolo in self.producciones:
+                        raise ValueError(f"❌ La producción {no_terminal} → {produccion} no es lineal por la derecha")
+                
+                if not terminales:
+                    epsilon.setdefault(no_terminal, []).append(destino)
+                    continue
+                
+                origen = no_terminal
+                for i, simbolo in enumerate(terminales):
+                    simbolos.add(simbolo)
+                    siguiente = destino if i == len(terminales) - 1 else (no_terminal, produccion, i)
+                    simbolo_trans.setdefault(origen, []).append((simbolo, siguiente))
+                    origen = siguiente
+        
+        def cerradura(estados):
+            pila = list(estados)
+            resultado = set(estados)
+            while pila:
+                for destino in epsilon.get(pila.pop(), ()):
+                    if destino not in resultado:
+                        resultado.add(destino)
+                        pila.append(destino)
+            return frozenset(resultado)
+        
+        simbolos = sorted(simbolos)
+        inicial = cerradura([self.simbolo_inicial])
+        indices = {inicial: 0}
+        pendientes = [inicial]
+        transiciones = [{}]
+        finales = set()
+        
+        while pendientes:
+            conjunto = pendientes.pop()
+            indice = indices[conjunto]
+            if FINAL in conjunto:
+                finales.add(indice)
+            for simbolo in simbolos:
+                destinos = [
+                    destino
+                    for estado in conjunto
+                    for (s, destino) in simbolo_trans.get(estado, ())
+                    if s == simbolo
+                ]
+                if not destinos:
+                    continue
+                siguiente = cerradura(destinos)
+                if siguiente not in indices:
+                    indices[siguiente] = len(indices)
+                    transiciones.append({})
+                    pendientes.append(siguiente)
+                transiciones[indice][simbolo] = indices[siguiente]
+        
+        return transiciones, finales, simbolos
+    
+    def acepta(self, cadena):
+        """Verifica la pertenencia sin imprimir nada, usando el AFD equivalente"""
+        if getattr(self, "_afd", None) is None:
+            self._afd = self.construir_afd()
+        transiciones, finales, _ = self._afd
+        estado = 0
+        for simbolo in cadena:
+            estado = transiciones[estado].get(simbolo)
+            if estado is None:
+                return False
+        return estado in finales
+    
     def derivar_bfs(self, objetivo):
         """
         Búsqueda BFS (amplitud) para encontrar derivación.
         Más robusto que DFS para gramáticas regulares.
         
+        Cada forma sentencial guarda solo su padre y la producción aplicada
+        (la ruta se reconstruye al final); si se superan max_nodos formas
+        se continúa con profundización iterativa (ver utils/busqueda.py).
+        
         Retorna: (éxito: bool, ruta: list)
         """
-        # Cola: (forma_sentencial, historial_completo)
-        cola = deque([(self.simbolo_inicial, [self.simbolo_inicial])])
-        visitados = {self.simbolo_inicial}
-        pasos = 0
-        
-        while cola and pasos < self.max_pasos:
-            actual, historial = cola.popleft()
-            pasos += 1
-            
-            # ¿Alcanzamos el objetivo?
-            if actual == objetivo:
-                return True, historial
-            
-            # Poda inteligente: si ya tenemos más terminales consumidos que el objetivo
-            terminales_actuales = self._contar_terminales(actual)
-            if terminales_actuales > len(objetivo):
-                continue
-            
-            # Expandir: buscar el primer (o único) no-terminal
-            expandido = False
+        def expandir(actual):
+            # En gramáticas lineales derechas, solo expandimos el primer no-terminal
             for i, simbolo in enumerate(actual):
                 if simbolo in self.producciones:
-                    # Expandir este no-terminal con todas sus producciones
-                    for produccion in self.producciones[simbolo]:
-                        # Aplicar la producción
-                        if self.es_epsilon(produccion):
-                            # A → ε: eliminar el no-terminal
-                            nueva = actual[:i] + actual[i+1:]
-                        else:
-                            # A → α: reemplazar el no-terminal
-                            nueva = actual[:i] + produccion + actual[i+1:]
-                        
-                        # Evitar ciclos
-                        if nueva not in visitados:
-                            visitados.add(nueva)
-                            nuevo_historial = historial + [nueva]
-                            cola.append((nueva, nuevo_historial))
-                    
-                    expandido = True
-                    # En gramáticas lineales derechas, solo expandimos el primer no-terminal
                     break
+            else:
+                # Sin no-terminales: rama muerta (el objetivo se detecta al generarlo)
+                return
             
-            # Si no hay no-terminales y no coincide, es una rama muerta
-            if not expandido and actual != objetivo:
-                continue
+            for produccion in self.producciones[simbolo]:
+                if self.es_epsilon(produccion):
+                    # A → ε: eliminar el no-terminal
+                    nueva = actual[:i] + actual[i+1:]
+                    mostrar = "ε"
+                else:
+                    # A → α: reemplazar el no-terminal
+                    nueva = actual[:i] + produccion + actual[i+1:]
+                    mostrar = produccion
+                
+                # Poda: más terminales que el objetivo o un prefijo que ya no coincide
+                if self._contar_terminales(nueva) > len(objetivo):
+                    continue
+                j = next((k for k, s in enumerate(nueva) if s in self.producciones), len(nueva))
+                if nueva[:j] != objetivo[:j]:
+                    continue
+                
+                yield nueva, f"{simbolo} → {mostrar}"
         
-        return False, []
+        self.busqueda = BusquedaDerivacion(expandir, self.max_pasos, self.max_nodos)
+        exito, ruta, producciones = self.busqueda.buscar(self.simbolo_inicial, objetivo)
+        self.producciones_aplicadas = producciones
+        return exito, ruta
     
     def _contar_terminales(self, cadena):
         """Cuenta cuántos símbolos terminales hay en la cadena"""
@@ -205,6 +288,8 @@ class ModoGramaticaRegular:
         
         # Intentar derivar con BFS (más robusto)
         exito, ruta = self.derivar_bfs(self.entrada)
+        if self.busqueda.profundizacion:
+            print(f"🧠 Se superaron {self.max_nodos} formas guardadas: se continuó con profundización iterativa")
         
         # Si BFS falla, intentar con DFS mejorado
         if not exito:
@@ -217,8 +302,12 @@ class ModoGramaticaRegular:
             print(f"\n🔍 Derivación encontrada ({len(ruta)} pasos):")
             print("─" * 50)
             
+            # Producciones aplicadas (solo las registra la búsqueda BFS)
+            producciones = self.producciones_aplicadas if len(self.producciones_aplicadas) == len(ruta) - 1 else []
             for i, paso in enumerate(ruta):
                 paso_mostrar = paso if paso != "" else "ε"
+                if producciones and i > 0:
+                    paso_mostrar += f"  [{producciones[i - 1]}]"
                 
                 if i == 0:
                     print(f"  Paso {i}: {paso_mostrar} (inicio)")
@@ -1,7 +1,15 @@
 # modos/mt.py
 """
 Simula una Máquina de Turing (MT) con salida detallada paso a paso.
+
+Las ejecuciones largas pueden guardar checkpoints de su configuración
+completa (estado, cinta, cabezal y pasos) y reanudarse después con un
+nuevo presupuesto de pasos:
+- checkpoint_ruta: archivo donde se guarda el checkpoint
+- checkpoint_cada: guardar cada N pasos (0 = solo al agotar max_pasos)
+- reanudar_desde: checkpoint desde el que continuar si la entrada coincide
 """
+from utils.helpers import cargar_checkpoint, guardar_checkpoint, huella_modelo
 
 class ModoMT:
     
@@ -15,13 +23,12 @@ class ModoMT:
         self.descripcion = data.get("descripcion", "Sin descripción")
         self.simbolo_blanco = data.get("simbolo_blanco", "_")
         self.max_pasos = data.get("max_pasos", 1000)
+        self.checkpoint_ruta = data.get("checkpoint_ruta")
+        self.checkpoint_cada = data.get("checkpoint_cada", 0)
+        self.reanudar_desde = data.get("reanudar_desde")
 
         # Inicializar cinta
-        self.cinta = list(self.entrada) if self.entrada else [self.simbolo_blanco]
-        self.cinta += [self.simbolo_blanco] * 50
-        
-        self.pos = 0
-        self.estado = self.estado_inicial
+        self._reiniciar()
 
         # Convertir transiciones "(q0, '1')" → ('q0', '1')
         self.transiciones = {}
@@ -40,6 +47,106 @@ class ModoMT:
         if self.estado_inicial not in self.estados:
             raise ValueError(f"❌ El estado inicial '{self.estado_inicial}' no está en estados")
 
+    def _reiniciar(self):
+        """Prepara cinta, cabezal y estado para procesar self.entrada"""
+        self.cinta = list(self.entrada) if self.entrada else [self.simbolo_blanco]
+        self.cinta += [self.simbolo_blanco] * 50
+        self.pos = 0
+        self.estado = self.estado_inicial
+
+    def _huella(self):
+        """Identifica la máquina para no reanudar checkpoints de otra"""
+        return huella_modelo(self.estado_inicial, self.estados_finales,
+                             self.simbolo_blanco, self.transiciones_raw)
+
+    def _guardar_checkpoint(self, pasos):
+        """Guarda la configuración actual en checkpoint_ruta"""
+        guardar_checkpoint(self.checkpoint_ruta, {
+            "modo": "MT",
+            "huella": self._huella(),
+            "entrada": self.entrada,
+            "estado": self.estado,
+            "cinta": self.cinta,
+            "pos": self.pos,
+            "pasos": pasos,
+        })
+
+    def _checkpoint_periodico(self, pasos):
+        if self.checkpoint_ruta and self.checkpoint_cada and pasos % self.checkpoint_cada == 0:
+            self._guardar_checkpoint(pasos)
+
+    def _reanudar(self):
+        """
+        Restaura la configuración de reanudar_desde si existe y corresponde
+        a esta máquina y a la entrada actual.
+        Retorna: pasos ya ejecutados o None si se empieza desde cero
+        """
+        if not self.reanudar_desde:
+            return None
+        checkpoint = cargar_checkpoint(self.reanudar_desde)
+        if checkpoint is None or checkpoint.get("entrada") != self.entrada:
+            return None
+        if checkpoint.get("modo") != "MT" or checkpoint.get("huella") != self._huella():
+            raise ValueError(f"❌ El checkpoint '{self.reanudar_desde}' no corresponde a esta máquina")
+        self.estado = checkpoint["estado"]
+        self.cinta = checkpoint["cinta"]
+        self.pos = checkpoint["pos"]
+        return checkpoint["pasos"]
+
+    def _nombre_estado(self, estado):
+        """Nombre del estado para mostrar"""
+        return estado
+
+    def _buscar_transicion(self, estado, simbolo):
+        """Retorna (nuevo_estado, escribir, mover) usando transición exacta o comodín, o None"""
+        if (estado, simbolo) in self.transiciones:
+            return self.transiciones[(estado, simbolo)]
+        return self.transiciones.get((estado, "*"))
+
+    def _paso(self, nuevo_estado, escribir, mover):
+        """Escribe, cambia de estado y mueve el cabezal"""
+        # ESCRIBIR
+        self.cinta[self.pos] = escribir
+
+        # CAMBIAR ESTADO
+        self.estado = nuevo_estado
+
+        # MOVER CABEZAL
+        if mover == "R":
+            self.pos += 1
+            if self.pos >= len(self.cinta):
+                self.cinta.append(self.simbolo_blanco)
+
+        elif mover == "L":
+            if self.pos == 0:
+                # EXTENDER CINTA A LA IZQUIERDA
+                self.cinta.insert(0, self.simbolo_blanco)
+                # El cabezal queda en 0 automáticamente
+            else:
+                self.pos -= 1
+
+        # MOVIMIENTO S → no mover
+
+    def acepta(self, cadena):
+        """Ejecuta la máquina sin imprimir nada y retorna True si llega a un estado final"""
+        self.entrada = cadena
+        self._reiniciar()
+        pasos = self._reanudar() or 0
+        limite = pasos + self.max_pasos
+        while pasos < limite:
+            transicion = self._buscar_transicion(self.estado, self.cinta[self.pos])
+            if transicion is None:
+                break
+            self._paso(*transicion)
+            pasos += 1
+            if self.estado in self.estados_finales:
+                break
+            self._checkpoint_periodico(pasos)
+        else:
+            if self.checkpoint_ruta:
+                self._guardar_checkpoint(pasos)
+        return self.estado in self.estados_finales
+
     def _visualizar_cinta(self, margen=12):
         inicio = max(0, self.pos - margen)
         fin = min(len(self.cinta), self.pos + margen + 1)
@@ -55,74 +162,64 @@ class ModoMT:
         print("────────────────────────────────────────\n")
 
     def ejecutar(self):
+        self._reiniciar()
+        reanudado = self._reanudar()
+
         print(f"\n📝 Descripción: {self.descripcion}")
-        print(f"🎯 Estado inicial: {self.estado_inicial}")
+        print(f"🎯 Estado inicial: {self._nombre_estado(self.estado_inicial)}")
         print(f"🎉 Estados finales: {self.estados_finales}")
         print(f"📥 Entrada: '{self.entrada}'\n")
 
         self._mostrar_transiciones()
 
-        pasos = 0
+        pasos = reanudado or 0
+        limite = pasos + self.max_pasos
 
         # Mostrar configuración inicial
         cinta, caret = self._visualizar_cinta()
+        if reanudado is not None:
+            print(f"♻️  Reanudando desde '{self.reanudar_desde}' (paso {pasos})")
         print("CONFIGURACIÓN INICIAL")
         print("────────────────────────────────────────")
         print(f"Cinta: [{cinta}]")
         print(f"       {caret}")
-        print(f"Estado: {self.estado}, Pos: {self.pos}")
+        print(f"Estado: {self._nombre_estado(self.estado)}, Pos: {self.pos}")
         print("────────────────────────────────────────\n")
 
-        while pasos < self.max_pasos:
+        while pasos < limite:
 
             simbolo = self.cinta[self.pos]
 
             # Usar transición exacta o comodín
-            if (self.estado, simbolo) in self.transiciones:
-                nuevo_estado, escribir, mover = self.transiciones[(self.estado, simbolo)]
-            elif (self.estado, "*") in self.transiciones:
-                nuevo_estado, escribir, mover = self.transiciones[(self.estado, "*")]
-            else:
-                print(f"⏹️  Paso {pasos + 1}: sin transición para ({self.estado}, '{simbolo}')")
+            transicion = self._buscar_transicion(self.estado, simbolo)
+            if transicion is None:
+                print(f"⏹️  Paso {pasos + 1}: sin transición para ({self._nombre_estado(self.estado)}, '{simbolo}')")
                 break
+            nuevo_estado, escribir, mover = transicion
 
             simbolo_prev = simbolo
-
-            # ESCRIBIR
-            self.cinta[self.pos] = escribir
-
-            # CAMBIAR ESTADO
             estado_prev = self.estado
-            self.estado = nuevo_estado
-
-            # MOVER CABEZAL
-            if mover == "R":
-                self.pos += 1
-                if self.pos >= len(self.cinta):
-                    self.cinta.append(self.simbolo_blanco)
-
-            elif mover == "L":
-                if self.pos == 0:
-                    # EXTENDER CINTA A LA IZQUIERDA
-                    self.cinta.insert(0, self.simbolo_blanco)
-                    # El cabezal queda en 0 automáticamente
-                else:
-                    self.pos -= 1
-
-            # MOVIMIENTO S → no mover
+            self._paso(nuevo_estado, escribir, mover)
 
             pasos += 1
 
             # IMPRIMIR ESTADO DEL PASO
             cinta, caret = self._visualizar_cinta()
-            print(f"Paso {pasos}: δ({estado_prev}, '{simbolo_prev}') → ({nuevo_estado}, '{escribir}', {mover})")
+            print(f"Paso {pasos}: δ({self._nombre_estado(estado_prev)}, '{simbolo_prev}') → ({self._nombre_estado(nuevo_estado)}, '{escribir}', {mover})")
             print(f"        [{cinta}]")
             print(f"        {caret}\n")
 
             if self.estado in self.estados_finales:
-                print(f"✔ Estado final '{self.estado}' alcanzado.\n")
+                print(f"✔ Estado final '{self._nombre_estado(self.estado)}' alcanzado.\n")
                 break
 
+            self._checkpoint_periodico(pasos)
+        else:
+            print(f"⚠️  Se agotó el presupuesto de {self.max_pasos} pasos")
+            if self.checkpoint_ruta:
+                self._guardar_checkpoint(pasos)
+                print(f"💾 Checkpoint guardado en '{self.checkpoint_ruta}' (paso {pasos})")
+
         # Mostrar cinta final
         cinta_final = ''.join(self.cinta).rstrip(self.simbolo_blanco)
         if cinta_final == "":
@@ -131,7 +228,7 @@ class ModoMT:
         print("\n────────────────────────────────────────")
         print("CONFIGURACIÓN FINAL")
         print(f"Cinta: [{cinta_final}]")
-        print(f"Estado final: {self.estado}")
+        print(f"Estado final: {self._nombre_estado(self.estado)}")
         print(f"Pasos ejecutados: {pasos}")
         print("────────────────────────────────────────")
 
@@ -0,0 +1,207 @@
+# modos/producto_afd.py
+"""
+Simula combinaciones booleanas de AFDs mediante autómatas producto perezosos
+
+Un estado del producto es la tupla de estados de sus componentes
+(None representa el estado sumidero de un componente). Los estados y
+transiciones del producto se crean solo cuando la entrada los alcanza y
+se memorizan, así que nunca se materializa el producto completo.
+
+Operaciones: interseccion, union, complemento y diferencia.
+Una sola pasada sobre la cadena evalúa toda la combinación.
+"""
+import os
+
+from modos import binario, registro
+from utils.helpers import cargar_configuracion
+
+
+class AutomataProducto:
+    def __init__(self, componentes, criterio, nombre="producto"):
+        """
+        componentes: autómatas con estado_inicial, transicion(), es_final() y alfabeto
+        criterio: función que recibe la lista de aceptaciones de los componentes
+        """
+        self.componentes = list(componentes)
+        self.criterio = criterio
+        self.nombre = nombre
+        self.estado_inicial = tuple(c.estado_inicial for c in self.componentes)
+
+        # Memorización: solo contiene los estados alcanzados
+        self._transiciones = {}
+        self._finales = {}
+        self._estados = {self.estado_inicial}
+
+    @property
+    def alfabeto(self):
+        simbolos = []
+        for componente in self.componentes:
+            for simbolo in componente.alfabeto:
+                if simbolo not in simbolos:
+                    simbolos.append(simbolo)
+        return simbolos
+
+    @property
+    def estados_explorados(self):
+        """Cantidad de estados del producto creados hasta ahora"""
+        return len(self._estados)
+
+    def transicion(self, estado, simbolo):
+        """
+        Retorna el estado destino o None si el producto queda en un
+        sumidero que no acepta ninguna continuación.
+        """
+        clave = (estado, simbolo)
+        if clave in self._transiciones:
+            return self._transiciones[clave]
+
+        destino = tuple(
+            None if q is None else componente.transicion(q, simbolo)
+            for componente, q in zip(self.componentes, estado)
+        )
+        # Todos los componentes en su sumidero: el producto ya no cambia
+        if all(q is None for q in destino) and not self.es_final(destino):
+            destino = None
+        else:
+            self._estados.add(destino)
+
+        self._transiciones[clave] = destino
+        return destino
+
+    def es_final(self, estado):
+        """Verifica si un estado del producto es de aceptación"""
+        if estado in self._finales:
+            return self._finales[estado]
+        aceptaciones = [
+            q is not None and componente.es_final(q)
+            for componente, q in zip(self.componentes, estado)
+        ]
+        final = bool(self.criterio(aceptaciones))
+        self._finales[estado] = final
+        return final
+
+    def acepta(self, cadena):
+        """Procesa la cadena en una sola pasada y retorna True si es aceptada"""
+        estado = self.estado_inicial
+        for simbolo in cadena:
+            estado = self.transicion(estado, simbolo)
+            if estado is None:
+                return False
+        return self.es_final(estado)
+
+
+def interseccion(*automatas):
+    """L(A1) ∩ L(A2) ∩ ..."""
+    return AutomataProducto(automatas, all, "interseccion")
+
+
+def union(*automatas):
+    """L(A1) ∪ L(A2) ∪ ..."""
+    return AutomataProducto(automatas, any, "union")
+
+
+def complemento(automata):
+    """Σ* \\ L(A)"""
+    return AutomataProducto([automata], lambda f: not f[0], "complemento")
+
+
+def diferencia(a, b):
+    """L(A) \\ L(B)"""
+    return AutomataProducto([a, b], lambda f: f[0] and not f[1], "diferencia")
+
+
+OPERACIONES = {
+    "interseccion": interseccion,
+    "union": union,
+    "complemento": complemento,
+    "diferencia": diferencia,
+}
+
+def cargar_automata(referencia):
+    """
+    Construye un autómata a partir de:
+    - el nombre de un archivo JSON de un modo con transicion() y es_final()
+      (AFD, EXPRESION_REGULAR, ...)
+    - un modelo binario .simb de un AFD (ver modos/binario.py)
+    - una configuración en línea (diccionario con "modo")
+    - una operación: {"diferencia": [ref_a, ref_b]}, {"complemento": ref}, ...
+    """
+    if isinstance(referencia, str) and referencia.endswith(binario.EXTENSION):
+        ruta = referencia if os.path.isfile(referencia) else os.path.join("ejemplos", referencia)
+        automata = binario.cargar(ruta)
+        if not isinstance(automata, binario.AFDBinario):
+            raise ValueError(f"❌ El modelo '{referencia}' no es un AFD y no se puede combinar")
+        return automata
+
+    if isinstance(referencia, str):
+        referencia = cargar_configuracion(referencia)
+
+    if not isinstance(referencia, dict):
+        raise ValueError(f"❌ Referencia de autómata no válida: {referencia!r}")
+
+    if "modo" in referencia:
+        modo = referencia["modo"].upper()
+        if modo == "PRODUCTO_AFD":
+            return cargar_automata(referencia.get("operacion"))
+        clase = registro.obtener_modo(modo)
+        if not hasattr(clase, "transicion") or not hasattr(clase, "es_final"):
+            raise ValueError(f"❌ El modo '{modo}' no es un autómata determinista y no se puede combinar")
+        return clase(referencia)
+
+    if len(referencia) != 1:
+        raise ValueError("❌ Cada operación debe tener exactamente una clave")
+
+    nombre, argumentos = next(iter(referencia.items()))
+    if nombre not in OPERACIONES:
+        raise ValueError(f"❌ Operación '{nombre}' no reconocida. Operaciones válidas: {', '.join(OPERACIONES)}")
+    if not isinstance(argumentos, list):
+        argumentos = [argumentos]
+    return OPERACIONES[nombre](*[cargar_automata(arg) for arg in argumentos])
+
+
+class ModoProductoAFD:
+    def __init__(self, data):
+        self.operacion = data.get("operacion")
+        self.entrada = data.get("entrada", "")
+        self.descripcion = data.get("descripcion", "Sin descripción")
+
+        # Validar configuración
+        if not self.operacion:
+            raise ValueError("❌ Falta definir la operación")
+
+        self.automata = cargar_automata(self.operacion)
+
+    def acepta(self, cadena):
+        """Evalúa la combinación sin imprimir nada"""
+        return self.automata.acepta(cadena)
+
+    def ejecutar(self):
+        """Ejecuta la simulación del autómata producto en una sola pasada"""
+        estado = self.automata.estado_inicial
+
+        print(f"\n📝 Descripción: {self.descripcion}")
+        print(f"🧮 Operación: {self.operacion}")
+        print(f"🎯 Estado inicial: {estado}")
+        print(f"📥 Cadena de entrada: '{self.entrada}'")
+
+        print(f"\n{'─'*50}")
+        print("Procesando transiciones:")
+        print(f"{'─'*50}")
+
+        for i, simbolo in enumerate(self.entrada, 1):
+            nuevo_estado = self.automata.transicion(estado, simbolo)
+            if nuevo_estado is None:
+                print(f"\n❌ Paso {i}: δ({estado}, '{simbolo}') lleva a un sumidero")
+                print(f"❌ Cadena RECHAZADA")
+                return
+            print(f"  Paso {i}: δ({estado}, '{simbolo}') → {nuevo_estado}")
+            estado = nuevo_estado
+
+        print(f"\n{'─'*50}")
+        print(f"🏁 Estado final alcanzado: {estado}")
+        print(f"🔢 Estados del producto explorados: {self.automata.estados_explorados}")
+
+        if self.automata.es_final(estado):
+            print("✅ Cadena ACEPTADA ✅")
+        else:
+            print("❌ Cadena RECHAZADA (la combinación no acepta este estado)")
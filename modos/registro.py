@@ -0,0 +1,109 @@
+# modos/registro.py
+"""
+Registro de modos con carga perezosa
+
+Cada modo se registra con su nombre y la ruta "modulo:Clase". El módulo
+se importa solo cuando se selecciona una configuración de ese modo, así
+que el arranque no paga la importación de todos los modos.
+
+Los paquetes instalados pueden agregar modos propios declarando entry
+points en el grupo "simulador.modos", por ejemplo en su pyproject.toml:
+
+    [project.entry-points."simulador.modos"]
+    MI_MODO = "mi_paquete.modos:ModoMiModo"
+
+Interfaz uniforme de un modo:
+- compilar(data): construye el simulador una sola vez por configuración
+- ejecutar(simulador, entrada): simulación con salida detallada
+- ejecutar_lote(simulador, entradas): lista de aceptaciones sin imprimir
+  (requiere que el modo defina acepta(cadena))
+"""
+import importlib
+
+GRUPO_ENTRY_POINTS = "simulador.modos"
+
+# nombre → "modulo:Clase" (sin importar) o la clase ya cargada
+_modos = {
+    "AFD": "modos.afd:ModoAFD",
+    "GLC": "modos.glc:ModoGLC",
+    "GRAMATICA_REGULAR": "modos.gramatica_regular:ModoGramaticaRegular",
+    "AP": "modos.ap:ModoAP",
+    "MT": "modos.mt:ModoMT",
+    "EXPRESION_REGULAR": "modos.expresion_regular:ModoExpresionRegular",
+    "PRODUCTO_AFD": "modos.producto_afd:ModoProductoAFD",
+    "EQUIVALENCIA_AFD": "modos.equivalencia_afd:ModoEquivalenciaAFD",
+    "ENUMERACION": "modos.enumeracion:ModoEnumeracion",
+    "DIFERENCIAL": "modos.diferencial:ModoDiferencial",
+    "BOSQUE_GLC": "modos.bosque_glc:ModoBosqueGLC",
+}
+
+_entry_points_cargados = False
+
+
+def registrar_modo(nombre, referencia):
+    """
+    Registra un modo. 'referencia' puede ser la clase o la ruta
+    "modulo:Clase" para importarla solo cuando se use.
+    """
+    _modos[nombre.upper()] = referencia
+
+
+def _cargar_entry_points():
+    """Agrega los modos declarados por paquetes instalados (sin importarlos)"""
+    global _entry_points_cargados
+    if _entry_points_cargados:
+        return
+    _entry_points_cargados = True
+
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return
+
+    try:
+        puntos = entry_points(group=GRUPO_ENTRY_POINTS)
+    except TypeError:
+        # Python < 3.10
+        puntos = entry_points().get(GRUPO_ENTRY_POINTS, [])
+
+    for punto in puntos:
+        _modos.setdefault(punto.name.upper(), punto.value)
+
+
+def modos_disponibles():
+    """Nombres de todos los modos registrados"""
+    _cargar_entry_points()
+    return list(_modos)
+
+
+def obtener_modo(nombre):
+    """Retorna la clase del modo, importando su módulo si hace falta"""
+    _cargar_entry_points()
+    nombre = nombre.upper()
+    if nombre not in _modos:
+        raise ValueError(f"❌ Modo '{nombre}' no reconocido. Modos válidos: {', '.join(_modos)}")
+
+    referencia = _modos[nombre]
+    if isinstance(referencia, str):
+        modulo, _, clase = referencia.partition(":")
+        referencia = getattr(importlib.import_module(modulo), clase)
+        _modos[nombre] = referencia
+    return referencia
+
+
+def compilar(data):
+    """Construye el simulador de la configuración según su campo "modo" """
+    return obtener_modo(data.get("modo", ""))(data)
+
+
+def ejecutar(simulador, entrada):
+    """Ejecuta el simulador sobre una entrada, con salida detallada"""
+    simulador.entrada = entrada
+    return simulador.ejecutar()
+
+
+def ejecutar_lote(simulador, entradas):
+    """Procesa varias entradas sin imprimir. Retorna la lista de aceptaciones"""
+    if not hasattr(simulador, "acepta"):
+        raise ValueError(f"❌ El modo {type(simulador).__name__} no admite ejecución por lotes")
+    return [simulador.acepta(entrada) for entrada in entradas]
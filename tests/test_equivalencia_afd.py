@@ -0,0 +1,80 @@
+# tests/test_equivalencia_afd.py
+"""Equivalencia e inclusión de AFDs contra una búsqueda exhaustiva de cadenas"""
+import itertools
+import random
+import unittest
+
+from modos.afd import ModoAFD
+from modos.equivalencia_afd import esta_incluido, son_equivalentes
+
+
+def _afd_aleatorio(rng, estados, simbolos):
+    nombres = [f"q{i}" for i in range(estados)]
+    transiciones = {}
+    for estado in nombres:
+        fila = {s: rng.choice(nombres) for s in simbolos if rng.random() < 0.8}
+        if fila:
+            transiciones[estado] = fila
+    return ModoAFD({
+        "alfabeto": ["a", "b"],
+        "estados": nombres,
+        "estado_inicial": "q0",
+        "estados_finales": [q for q in nombres if rng.random() < 0.5],
+        "transiciones": transiciones,
+    })
+
+
+def _primera_diferencia(a, b, simbolos, max_longitud, relacion):
+    """Cadena más corta que viola la relación, o None"""
+    for longitud in range(max_longitud + 1):
+        for tupla in itertools.product(simbolos, repeat=longitud):
+            cadena = "".join(tupla)
+            en_a, en_b = a.acepta(cadena), b.acepta(cadena)
+            if (en_a and not en_b) if relacion == "inclusion" else en_a != en_b:
+                return cadena
+    return None
+
+
+class TestEquivalenciaAFD(unittest.TestCase):
+    def test_contra_fuerza_bruta(self):
+        rng = random.Random(28)
+        # 'c' no está en el alfabeto declarado y '*' es el comodín
+        simbolos_transicion = ["a", "b", "c", "*"]
+        simbolos_prueba = ["a", "b", "c", "z"]
+        for _ in range(200):
+            a = _afd_aleatorio(rng, rng.randint(1, 3), simbolos_transicion)
+            b = _afd_aleatorio(rng, rng.randint(1, 2), simbolos_transicion)
+            # Un par distinguible tiene una cadena de longitud < |A|·|B| (+1 por los sumideros)
+            cota = (len(a.estados) + 1) * (len(b.estados) + 1)
+            for relacion, verificar in (("equivalencia", son_equivalentes), ("inclusion", esta_incluido)):
+                se_cumple, contraejemplo = verificar(a, b)
+                esperado = _primera_diferencia(a, b, simbolos_prueba, cota, relacion)
+                self.assertEqual(se_cumple, esperado is None, relacion)
+                if esperado is None:
+                    continue
+                self.assertEqual(len(contraejemplo), len(esperado), relacion)
+                self.assertTrue(a.acepta(contraejemplo) != b.acepta(contraejemplo), relacion)
+                if relacion == "inclusion":
+                    self.assertTrue(a.acepta(contraejemplo))
+
+    def test_inclusion_con_simbolo_fuera_del_alfabeto(self):
+        a = ModoAFD({
+            "alfabeto": ["a"],
+            "estados": ["q0", "q1"],
+            "estado_inicial": "q0",
+            "estados_finales": ["q0", "q1"],
+            "transiciones": {"q0": {"c": "q1"}},
+        })
+        b = ModoAFD({
+            "alfabeto": ["a"],
+            "estados": ["p0"],
+            "estado_inicial": "p0",
+            "estados_finales": ["p0"],
+            "transiciones": {},
+        })
+        self.assertEqual(esta_incluido(a, b), (False, "c"))
+        self.assertEqual(esta_incluido(b, a), (True, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
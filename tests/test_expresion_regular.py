@@ -0,0 +1,53 @@
+# tests/test_expresion_regular.py
+"""Compara el AFD mínimo compilado con el módulo re sobre todas las cadenas cortas"""
+import itertools
+import re
+import unittest
+
+from modos.expresion_regular import ModoExpresionRegular, compilar_expresion
+from modos.equivalencia_afd import son_equivalentes
+from modos.afd import ModoAFD
+
+
+def _cadenas(alfabeto, max_longitud):
+    for longitud in range(max_longitud + 1):
+        for tupla in itertools.product(alfabeto, repeat=longitud):
+            yield "".join(tupla)
+
+
+class TestExpresionRegular(unittest.TestCase):
+    EXPRESIONES = [
+        "(a|b)*ab", "a*b+", "(ab|ba)?a", "((a|b)(a|b))*", "a(b|c)*c?",
+        "(a|bc)+", "b.a", "(a.)*", "a\\+b", "\\.a|b",
+    ]
+
+    def test_coincide_con_re(self):
+        for expresion in self.EXPRESIONES:
+            alfabeto = ["a", "b", "c", "+", "."]
+            modo = ModoExpresionRegular({"expresion": expresion, "alfabeto": alfabeto})
+            for cadena in _cadenas(alfabeto, 5):
+                esperado = re.fullmatch(expresion, cadena) is not None
+                self.assertEqual(modo.acepta(cadena), esperado, (expresion, cadena))
+
+    def test_es_minimo(self):
+        # Ningún par de estados del AFD compilado es equivalente
+        for expresion in self.EXPRESIONES:
+            compilado = compilar_expresion(expresion, ["a", "b", "c", "+", "."])
+            for p, q in itertools.combinations(compilado["estados"], 2):
+                a = ModoAFD(dict(compilado, estado_inicial=p))
+                b = ModoAFD(dict(compilado, estado_inicial=q))
+                self.assertFalse(son_equivalentes(a, b)[0], (expresion, p, q))
+
+    def test_asterisco_literal_rechazado(self):
+        with self.assertRaises(ValueError):
+            ModoExpresionRegular({"expresion": "a\\*b"})
+        with self.assertRaises(ValueError):
+            ModoExpresionRegular({"expresion": "a.b", "alfabeto": ["a", "b", "*"]})
+
+    def test_literal_fuera_del_alfabeto(self):
+        with self.assertRaises(ValueError):
+            ModoExpresionRegular({"expresion": "a|b", "alfabeto": ["a"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
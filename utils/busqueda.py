@@ -0,0 +1,108 @@
+"""
+Búsqueda de derivaciones sobre formas sentenciales con memoria acotada
+
+Cada nodo guarda solo un puntero a su forma padre y la producción
+aplicada; la ruta completa se reconstruye únicamente al llegar al
+objetivo. Se busca en amplitud (derivación más corta) mientras la
+cantidad de nodos guardados no supere max_nodos; al superarlo se libera
+todo y se continúa con profundización iterativa, que solo guarda la
+rama actual.
+"""
+
+
+class BusquedaDerivacion:
+    def __init__(self, expandir, max_profundidad, max_nodos):
+        """
+        expandir(forma): iterable de (nueva_forma, produccion), ya podado
+        max_profundidad: máximo de producciones aplicadas
+        max_nodos: máximo de formas guardadas durante la búsqueda en amplitud
+        """
+        self.expandir = expandir
+        self.max_profundidad = max_profundidad
+        self.max_nodos = max_nodos
+        self.nodos_explorados = 0
+        self.profundizacion = False
+
+    def buscar(self, inicial, objetivo):
+        """
+        Busca una derivación de 'objetivo' desde 'inicial'.
+        Retorna: (éxito, formas, producciones aplicadas)
+        """
+        self.nodos_explorados = 0
+        self.profundizacion = False
+        if inicial == objetivo:
+            return True, [inicial], []
+
+        # origen[forma] = (forma_padre, produccion)
+        origen = {inicial: None}
+        frontera = [inicial]
+        profundidad = 0
+        while frontera and profundidad < self.max_profundidad:
+            profundidad += 1
+            siguiente = []
+            for forma in frontera:
+                self.nodos_explorados += 1
+                for nueva, produccion in self.expandir(forma):
+                    if nueva in origen:
+                        continue
+                    origen[nueva] = (forma, produccion)
+                    if nueva == objetivo:
+                        return (True,) + self._reconstruir(origen, nueva)
+                    siguiente.append(nueva)
+
+                if len(origen) > self.max_nodos:
+                    # Límite de memoria: los niveles anteriores ya se exploraron completos
+                    origen = frontera = siguiente = None
+                    self.profundizacion = True
+                    return self._profundizar(inicial, objetivo, profundidad)
+            frontera = siguiente
+
+        return False, [], []
+
+    def _reconstruir(self, origen, forma):
+        formas = [forma]
+        producciones = []
+        while origen[forma] is not None:
+            forma, produccion = origen[forma]
+            formas.append(forma)
+            producciones.append(produccion)
+        return formas[::-1], producciones[::-1]
+
+    def _profundizar(self, inicial, objetivo, desde):
+        """DFS con límite creciente; la memoria es proporcional a la profundidad"""
+        for limite in range(desde, self.max_profundidad + 1):
+            formas = [inicial]
+            producciones = []
+            en_rama = {inicial}
+            pila = [iter(self.expandir(inicial))]
+            recortado = False
+
+            while pila:
+                siguiente = next(pila[-1], None)
+                if siguiente is None:
+                    pila.pop()
+                    en_rama.discard(formas.pop())
+                    if producciones:
+                        producciones.pop()
+                    continue
+
+                nueva, produccion = siguiente
+                if nueva in en_rama:
+                    continue
+                if nueva == objetivo:
+                    return True, formas + [nueva], producciones + [produccion]
+                if len(pila) >= limite:
+                    recortado = True
+                    continue
+
+                self.nodos_explorados += 1
+                formas.append(nueva)
+                producciones.append(produccion)
+                en_rama.add(nueva)
+                pila.append(iter(self.expandir(nueva)))
+
+            # Si ninguna rama llegó al límite, más profundidad no cambia nada
+            if not recortado:
+                break
+
+        return False, [], []
@@ -1,3 +1,6 @@
+import hashlib
+import json
+import os
 import string
 import sys
 
@@ -5,4 +8,51 @@ import sys
 Retorna una lista de caracteres permitidos
 """
 def obtener_alfabeto_default():
-    return [chr(i) for i in range(sys.maxunicode + 1)]
\ No newline at end of file
+    return [chr(i) for i in range(sys.maxunicode + 1)]
+
+"""
+Carga una configuración JSON. Las rutas relativas que no existen
+se buscan dentro de la carpeta de ejemplos.
+"""
+def cargar_configuracion(nombre_archivo, carpeta="ejemplos"):
+    ruta = nombre_archivo
+    if not os.path.isfile(ruta):
+        ruta = os.path.join(carpeta, nombre_archivo)
+    if not os.path.isfile(ruta):
+        raise ValueError(f"❌ El archivo '{nombre_archivo}' no existe")
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+"""
+Huella de un modelo: permite verificar que un checkpoint se reanude
+con la misma máquina que lo generó.
+"""
+def huella_modelo(*partes):
+    contenido = json.dumps(partes, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(contenido.encode("utf-8")).hexdigest()[:16]
+
+"""
+Guarda un checkpoint de simulación en JSON. Se escribe primero a un
+archivo temporal y luego se reemplaza, así una interrupción a mitad de
+la escritura nunca deja un checkpoint corrupto.
+"""
+def guardar_checkpoint(ruta, datos):
+    carpeta = os.path.dirname(ruta)
+    if carpeta:
+        os.makedirs(carpeta, exist_ok=True)
+    temporal = f"{ruta}.tmp"
+    with open(temporal, 'w', encoding='utf-8') as archivo:
+        json.dump(datos, archivo, ensure_ascii=False)
+    os.replace(temporal, ruta)
+
+"""
+Carga un checkpoint. Retorna None si el archivo no existe.
+"""
+def cargar_checkpoint(ruta):
+    if not os.path.isfile(ruta):
+        return None
+    try:
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            return json.load(archivo)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"❌ El checkpoint '{ruta}' está dañado: {e}")